@@ -1,10 +1,27 @@
 """Branch Monkey - Git for humans."""
 
+from importlib import import_module
+
 __version__ = "0.1.0"
 
-from .core.checkpoint import CheckpointManager
-from .core.experiment import ExperimentManager
-from .core.history import HistoryNavigator
-from .api import BranchMonkey
+# Public classes and the modules they live in. They are imported on first
+# access (PEP 562), so importing a submodule such as the prompt logger or
+# the MCP server doesn't load every manager and GitPython up front.
+_EXPORTS = {
+    "CheckpointManager": ".core.checkpoint",
+    "ExperimentManager": ".core.experiment",
+    "HistoryNavigator": ".core.history",
+    "BranchMonkey": ".api",
+}
 
 __all__ = ["BranchMonkey", "CheckpointManager", "ExperimentManager", "HistoryNavigator"]
+
+
+def __getattr__(name: str):
+    """Import a public class the first time it is accessed."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
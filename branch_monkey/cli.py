@@ -9,6 +9,8 @@ from rich.panel import Panel
 from rich.text import Text
 
 from .api import BranchMonkey
+from .core.history import HistoryNavigator
+from .core.prompts import PromptLogger
 from .tui.app import run_tui
 
 app = typer.Typer(
@@ -24,14 +26,17 @@ console = Console()
 def tui(
     path: Optional[Path] = typer.Option(
         None, "--path", "-p", help="Path to Git repository"
-    )
+    ),
+    graph_limit: int = typer.Option(
+        50, "--graph-limit", help="Number of commits to show in the graph"
+    ),
 ):
     """
     Launch the interactive TUI.
 
     This is the main visual interface with all features.
     """
-    run_tui(path)
+    run_tui(path, graph_limit=graph_limit)
 
 
 @app.command()
@@ -585,6 +590,56 @@ def context(
         raise typer.Exit(1)
 
 
+@app.command()
+def drain(
+    path: Optional[Path] = typer.Option(
+        None, "--path", "-p", help="Path to Git repository"
+    ),
+):
+    """
+    Write prompts queued by the Claude Code hook to the prompt log.
+
+    Queued prompts are also written whenever prompt logs are read, so this
+    is only needed to flush the queue ahead of time.
+
+    Example:
+        monkey drain
+    """
+    try:
+        logger = PromptLogger(path or Path.cwd())
+        try:
+            count = logger.drain_queue()
+        finally:
+            logger.close()
+        console.print(f"[green]✓[/green] Logged {count} queued prompt(s)")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def commit_graph(
+    path: Optional[Path] = typer.Option(
+        None, "--path", "-p", help="Path to Git repository"
+    ),
+):
+    """
+    Write git's commit-graph to speed up history on large repositories.
+
+    Run it again now and then so the graph covers newer commits; history
+    works without it, just more slowly.
+
+    Example:
+        monkey commit-graph
+    """
+    try:
+        HistoryNavigator(path or Path.cwd()).write_commit_graph()
+        console.print("[green]✓[/green] Wrote commit-graph")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -1,8 +1,17 @@
 """Core Git abstraction modules."""
 
-from .checkpoint import CheckpointManager, Checkpoint
-from .experiment import ExperimentManager, Experiment
-from .history import HistoryNavigator, HistoryEntry
+from importlib import import_module
+
+# Public classes and the modules they live in, imported on first access
+# (PEP 562) so importing one core module doesn't load all of them
+_EXPORTS = {
+    "CheckpointManager": ".checkpoint",
+    "Checkpoint": ".checkpoint",
+    "ExperimentManager": ".experiment",
+    "Experiment": ".experiment",
+    "HistoryNavigator": ".history",
+    "HistoryEntry": ".history",
+}
 
 __all__ = [
     "CheckpointManager",
@@ -12,3 +21,13 @@ __all__ = [
     "HistoryNavigator",
     "HistoryEntry",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public class the first time it is accessed."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,6 @@
 """Checkpoint system - simple save/restore abstraction over Git commits and stashes."""
 
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -165,12 +166,13 @@ class CheckpointManager:
 
                 self.repo.git.reset("--hard", checkpoint.id)
 
-    def list_checkpoints(self, limit: int = 20) -> List[Checkpoint]:
+    def list_checkpoints(self, limit: int = 20, with_stats: bool = True) -> List[Checkpoint]:
         """
         List recent checkpoints.
 
         Args:
             limit: Maximum number of checkpoints to return
+            with_stats: Whether to fill in the change stats (one diff per commit)
 
         Returns:
             List of checkpoints, newest first
@@ -179,7 +181,7 @@ class CheckpointManager:
 
         # Add commits
         for commit in self.repo.iter_commits(max_count=limit):
-            checkpoints.append(self._commit_to_checkpoint(commit))
+            checkpoints.append(self._commit_to_checkpoint(commit, with_stats))
 
         return checkpoints
 
@@ -230,6 +232,28 @@ class CheckpointManager:
 
         return checkpoints
 
+    def tip_hash(self) -> str:
+        """
+        Identify the current checkpoints and quick saves without running git.
+
+        Returns:
+            A string that changes whenever HEAD moves or a stash is added or
+            dropped, for skipping reloads when nothing has changed
+        """
+        try:
+            head = self.repo.head.commit.hexsha
+        except ValueError:
+            head = ""  # No commits yet
+
+        # The stash reflog is the stash list, one line per quick save
+        stash_log = Path(self.repo.common_dir) / "logs" / "refs" / "stash"
+        try:
+            stashes = hashlib.sha1(stash_log.read_bytes()).hexdigest()
+        except OSError:
+            stashes = ""
+
+        return f"{head}:{stashes}"
+
     def has_changes(self) -> bool:
         """Check if there are uncommitted changes."""
         return (
@@ -245,10 +269,10 @@ class CheckpointManager:
         except Exception:
             return None
 
-    def _commit_to_checkpoint(self, commit: git.Commit) -> Checkpoint:
-        """Convert Git commit to Checkpoint."""
+    def _commit_to_checkpoint(self, commit: git.Commit, with_stats: bool = True) -> Checkpoint:
+        """Convert Git commit to Checkpoint (stats left at 0 without with_stats)."""
         # Get stats
-        stats = commit.stats.total
+        stats = commit.stats.total if with_stats else {}
         files_changed = stats.get("files", 0)
         insertions = stats.get("insertions", 0)
         deletions = stats.get("deletions", 0)
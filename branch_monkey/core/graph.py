@@ -1,13 +1,55 @@
 """Git graph visualization - the main feature of Branch Monkey."""
 
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Set
+from itertools import islice
+from typing import Iterator, List, Dict, Optional, Tuple, Set
 from pathlib import Path
 import git
-from git.exc import InvalidGitRepositoryError
+from git.exc import GitCommandError, InvalidGitRepositoryError
 from datetime import datetime
 
 
+# git log format for graph nodes: sha, parents, commit time, author, raw message
+_LOG_FORMAT = "%H%x1f%P%x1f%ct%x1f%an%x1f%B"
+
+
+# Age buckets: lowest whole-second age of each unit after "now", and the
+# (unit length in seconds, suffix) used to format it
+_AGE_BOUNDS = [61, 3601, 86400, 31 * 86400, 366 * 86400]
+_AGE_UNITS = [(60, "m"), (3600, "h"), (86400, "d"), (30 * 86400, "mo"), (365 * 86400, "y")]
+
+
+def _format_age_seconds(seconds: float) -> str:
+    """Human-readable age for an elapsed number of seconds."""
+    seconds = int(seconds)
+    bucket = bisect_right(_AGE_BOUNDS, seconds)
+    if bucket == 0:
+        return "now"
+    unit, suffix = _AGE_UNITS[bucket - 1]
+    return f"{seconds // unit}{suffix}"
+
+
+def _next_age_change(seconds: float) -> int:
+    """Elapsed seconds at which the age formatted for an elapsed time next changes."""
+    seconds = int(seconds)
+    bucket = bisect_right(_AGE_BOUNDS, seconds)
+    if bucket == 0:
+        return _AGE_BOUNDS[0]
+    unit, _ = _AGE_UNITS[bucket - 1]
+    next_change = (seconds // unit + 1) * unit
+    if bucket < len(_AGE_BOUNDS):
+        next_change = min(next_change, _AGE_BOUNDS[bucket])
+    return next_change
+
+
+def _format_age(timestamp: datetime, now: datetime) -> str:
+    """Human-readable age of a timestamp relative to now."""
+    return _format_age_seconds((now - timestamp).total_seconds())
+
+
 @dataclass
 class CommitNode:
     """A commit in the graph."""
@@ -27,19 +69,51 @@ class CommitNode:
     @property
     def age(self) -> str:
         """Human-readable age."""
-        delta = datetime.now() - self.timestamp
-        if delta.days > 365:
-            return f"{delta.days // 365}y"
-        elif delta.days > 30:
-            return f"{delta.days // 30}mo"
-        elif delta.days > 0:
-            return f"{delta.days}d"
-        elif delta.seconds > 3600:
-            return f"{delta.seconds // 3600}h"
-        elif delta.seconds > 60:
-            return f"{delta.seconds // 60}m"
-        else:
-            return "now"
+        return _format_age(self.timestamp, datetime.now())
+
+
+@dataclass
+class CommitTable:
+    """
+    Column-oriented copy of the commit fields the renderer scans.
+
+    Render loops read these parallel arrays by index instead of pulling
+    attributes off one dataclass per commit. Indexing the table returns
+    the original CommitNode.
+    """
+
+    nodes: List[CommitNode]
+    short_shas: List[str]
+    messages: List[str]
+    authors: List[str]
+    timestamps: array  # epoch seconds
+    columns: array
+    is_head: bytearray
+    parents: List[Tuple[int, ...]]  # parent positions, -1 if outside the list
+
+    @classmethod
+    def from_nodes(cls, nodes: List[CommitNode]) -> "CommitTable":
+        """Build a table from a list of commit nodes."""
+        sha_to_idx = {}
+        for i, node in enumerate(nodes):
+            sha_to_idx.setdefault(node.sha, i)
+
+        return cls(
+            nodes=nodes,
+            short_shas=[node.short_sha for node in nodes],
+            messages=[node.message for node in nodes],
+            authors=[node.author for node in nodes],
+            timestamps=array("d", [node.timestamp.timestamp() for node in nodes]),
+            columns=array("i", [node.column for node in nodes]),
+            is_head=bytearray(node.is_head for node in nodes),
+            parents=[tuple(sha_to_idx.get(p, -1) for p in node.parents) for node in nodes],
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __getitem__(self, index: int) -> CommitNode:
+        return self.nodes[index]
 
 
 @dataclass
@@ -93,6 +167,27 @@ class GitGraph:
                 f"{self.repo_path} is not a Git repository."
             )
 
+        # SHA lookup indexes for the most recently built/queried node list
+        self._indexed_nodes: Optional[List[CommitNode]] = None
+        self._sha_index: Dict[str, CommitNode] = {}
+        self._short_sha_index: Dict[str, CommitNode] = {}
+        self._position_index: Dict[int, int] = {}  # id(node) -> list index
+        self._table = CommitTable.from_nodes([])
+
+        # Per-render caches for the left-hand graph strings
+        self._graph_part_cache: Dict[Tuple[int, int, bool], str] = {}
+        self._connector_cache: Dict[Tuple[int, int], List[str]] = {}
+
+        # Bumped by every build_graph, so a render cached before it isn't reused
+        self._build_count = 0
+        # Last rendered output: (nodes, key, time its ages stop being current, lines)
+        self._render_cache: Optional[
+            Tuple[List[CommitNode], tuple, float, List[GraphLine]]
+        ] = None
+
+        # Position of the HEAD commit in the last built node list, if loaded
+        self.head_index: Optional[int] = None
+
     def build_graph(self, limit: int = 50, all_branches: bool = True) -> List[CommitNode]:
         """
         Build the commit graph.
@@ -105,11 +200,7 @@ class GitGraph:
             List of CommitNodes in topological order (newest first)
         """
         nodes = []
-
-        # Get all commits
-        kwargs = {"max_count": limit}
-        if all_branches:
-            kwargs["all"] = True
+        head_index = None
 
         # Get HEAD commit SHA
         try:
@@ -117,100 +208,175 @@ class GitGraph:
         except Exception:
             head_sha = None
 
-        # Get branch information
-        branch_commits = {}  # sha -> [branch names]
-        for branch in self.repo.branches:
-            sha = branch.commit.hexsha
-            if sha not in branch_commits:
-                branch_commits[sha] = []
-            branch_commits[sha].append(branch.name)
-
-        # Get tag information
-        tag_commits = {}  # sha -> [tag names]
-        for tag in self.repo.tags:
-            sha = tag.commit.hexsha
-            if sha not in tag_commits:
-                tag_commits[sha] = []
-            tag_commits[sha].append(tag.name)
-
-        # Build nodes
-        for commit in self.repo.iter_commits(**kwargs):
-            sha = commit.hexsha
-            short_sha = sha[:7]
+        commits = list(self._raw_iter_commits(limit, all_branches))
 
-            # Get parent SHAs
-            parent_shas = [p.hexsha for p in commit.parents]
+        # Get branch and tag information for the loaded commits only
+        branch_commits, tag_commits = self._read_refs({commit[0] for commit in commits})
 
+        # Build nodes
+        for sha, parent_shas, committed_date, author, message in commits:
             # Get branches and tags
             branches = branch_commits.get(sha, [])
             tags = tag_commits.get(sha, [])
 
-            # Check if HEAD
-            is_head = sha == head_sha
-
-            # Check if merge
-            is_merge = len(parent_shas) > 1
-
             node = CommitNode(
                 sha=sha,
-                short_sha=short_sha,
-                message=commit.message.strip(),
-                author=commit.author.name,
-                timestamp=datetime.fromtimestamp(commit.committed_date),
+                short_sha=sha[:7],
+                message=message,
+                author=author,
+                timestamp=datetime.fromtimestamp(committed_date),
                 parents=parent_shas,
                 branches=branches,
                 tags=tags,
-                is_head=is_head,
-                is_merge=is_merge,
+                is_head=sha == head_sha,
+                is_merge=len(parent_shas) > 1,
             )
 
+            if node.is_head:
+                head_index = len(nodes)
             nodes.append(node)
 
+        self.head_index = head_index
+        self._build_count += 1
+        self._index_nodes(nodes)
+
         # Assign columns for visual positioning
-        self._assign_columns(nodes)
+        self._assign_columns(self._table)
 
         return nodes
 
-    def _assign_columns(self, nodes: List[CommitNode]) -> None:
+    def refs_signature(self) -> str:
+        """
+        Identify the refs a graph would be built from, with one show-ref call.
+
+        Returns:
+            HEAD and every ref with its commit; the same string means
+            build_graph would load the same commits and labels
+        """
+        try:
+            return self.repo.git.show_ref("--head")
+        except GitCommandError:
+            # No refs yet (empty repository)
+            return ""
+
+    def _read_refs(
+        self, commit_shas: Set[str]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Map commit SHAs to branch and tag names with a single show-ref call.
+
+        Args:
+            commit_shas: SHAs of the loaded commits; refs elsewhere are skipped
+
+        Returns:
+            Tuple of (sha -> [branch names], sha -> [tag names])
+        """
+        try:
+            output = self.repo.git.show_ref("--dereference")
+        except GitCommandError:
+            # No refs yet (empty repository)
+            output = ""
+
+        branch_commits: Dict[str, List[str]] = defaultdict(list)  # sha -> [branch names]
+        tag_shas = {}  # tag name -> sha (peeled for annotated tags)
+        for line in output.splitlines():
+            sha, _, ref = line.partition(" ")
+            if ref.startswith("refs/heads/"):
+                if sha in commit_shas:
+                    branch_commits[sha].append(ref[len("refs/heads/"):])
+            elif ref.startswith("refs/tags/"):
+                name = ref[len("refs/tags/"):]
+                # The "^{}" line follows the tag object and carries the commit
+                if name.endswith("^{}"):
+                    name = name[:-3]
+                tag_shas[name] = sha
+
+        tag_commits: Dict[str, List[str]] = defaultdict(list)  # sha -> [tag names]
+        for name, sha in tag_shas.items():
+            if sha in commit_shas:
+                tag_commits[sha].append(name)
+
+        return branch_commits, tag_commits
+
+    def _raw_iter_commits(
+        self, limit: int, all_branches: bool
+    ) -> Iterator[Tuple[str, List[str], int, str, str]]:
+        """
+        Read commit fields with a single git log call.
+
+        Avoids GitPython parsing each commit object again for every
+        attribute (message, author, date, parents) we touch.
+
+        Yields:
+            (sha, parent_shas, committed_date, author, message) tuples
+        """
+        output = self.repo.git.log(
+            "--all" if all_branches else "HEAD",
+            f"-n{limit}",
+            f"--format={_LOG_FORMAT}",
+            "-z",
+            "--",
+        )
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            sha, parents, committed_date, author, message = record.split("\x1f", 4)
+            yield sha, parents.split(), int(committed_date), author, message.strip()
+
+    def _index_nodes(self, nodes: List[CommitNode]) -> None:
+        """Build SHA and position lookup indexes and the render table for a node list."""
+        self._indexed_nodes = nodes
+        self._table = CommitTable.from_nodes(nodes)
+        self._sha_index = {}
+        self._short_sha_index = {}
+        self._position_index = {}
+        # Keep the first occurrence so lookups match a front-to-back scan
+        for i, node in enumerate(nodes):
+            self._sha_index.setdefault(node.sha, node)
+            self._short_sha_index.setdefault(node.short_sha, node)
+            self._position_index.setdefault(id(node), i)
+
+    def _assign_columns(self, table: CommitTable) -> None:
         """
         Assign horizontal column positions to commits.
 
         This determines where commits appear horizontally when branches split.
         """
-        # Build a map of sha -> node for quick lookup
-        node_map = {node.sha: node for node in nodes}
+        nodes = table.nodes
+        count = len(nodes)
+        columns = array("i", [0]) * count
+
+        # First parent's position for every commit, -1 if none/not loaded
+        first_parents = [parents[0] if parents else -1 for parents in table.parents]
 
         # Track which column each branch is using
         branch_columns: Dict[str, int] = {}
         next_column = 0
 
         # Process in order (already topologically sorted)
-        for node in nodes:
+        for i in range(count):
+            branches = nodes[i].branches
             # If this commit has branches, assign columns
-            if node.branches:
+            if branches:
                 # Use existing column or assign new one
-                assigned = False
-                for branch in node.branches:
+                for branch in branches:
                     if branch in branch_columns:
-                        node.column = branch_columns[branch]
-                        assigned = True
+                        columns[i] = branch_columns[branch]
                         break
-
-                if not assigned:
-                    node.column = next_column
-                    for branch in node.branches:
+                else:
+                    columns[i] = next_column
+                    for branch in branches:
                         branch_columns[branch] = next_column
                     next_column += 1
             else:
                 # Inherit from parent if possible
-                if node.parents:
-                    parent_sha = node.parents[0]
-                    if parent_sha in node_map:
-                        node.column = node_map[parent_sha].column
-                    else:
-                        node.column = 0
-                else:
-                    node.column = 0
+                parent = first_parents[i]
+                if parent >= 0:
+                    columns[i] = columns[parent]
+
+        table.columns = columns
+        for node, column in zip(nodes, columns):
+            node.column = column
 
     def render_graph(
         self,
@@ -229,83 +395,140 @@ class GitGraph:
         Returns:
             List of GraphLines to display
         """
-        lines = []
-
         if not nodes:
             return [GraphLine("No commits yet", None, False)]
 
+        if nodes is not self._indexed_nodes:
+            self._index_nodes(nodes)
+        table = self._table
+
+        # One clock read for the whole render
+        now = datetime.now()
+        now_ts = now.timestamp()
+
+        # Reuse the previous render of this same node list, unless a build ran
+        # since or one of the ages it shows has moved on
+        render_key = (self._build_count, width, show_details)
+        cache = self._render_cache
+        if cache is not None and cache[0] is nodes and cache[1] == render_key and now_ts < cache[2]:
+            return list(cache[3])
+
+        lines = list(self._render_graph_iter(nodes, width, show_details, now))
+        ages_valid_until = min(
+            timestamp + _next_age_change(now_ts - timestamp) for timestamp in table.timestamps
+        )
+        self._render_cache = (nodes, render_key, ages_valid_until, lines)
+        return list(lines)
+
+    def render_graph_window(
+        self,
+        nodes: List[CommitNode],
+        start: int,
+        count: int,
+        width: int = 80,
+        show_details: bool = True,
+    ) -> List[GraphLine]:
+        """
+        Render only a slice of the graph's lines.
+
+        Rendering stops once the window is filled, so showing the top of a
+        large graph doesn't pay for formatting the rest.
+
+        Args:
+            nodes: List of commit nodes
+            start: Index of the first line to return
+            count: Maximum number of lines to return
+            width: Maximum width for rendering
+            show_details: If True, shows commit message and details
+
+        Returns:
+            List of GraphLines in the window
+        """
+        lines = self._render_graph_iter(nodes, width, show_details)
+        return list(islice(lines, start, start + count))
+
+    def _render_graph_iter(
+        self,
+        nodes: List[CommitNode],
+        width: int,
+        show_details: bool,
+        now: Optional[datetime] = None,
+    ) -> Iterator[GraphLine]:
+        """Yield the rendered graph lines one at a time."""
+        if not nodes:
+            yield GraphLine("No commits yet", None, False)
+            return
+
+        if nodes is not self._indexed_nodes:
+            self._index_nodes(nodes)
+        table = self._table
+        columns = table.columns
+        is_head = table.is_head
+
         # Calculate max column to know total width needed
-        max_column = max(node.column for node in nodes) if nodes else 0
+        max_column = max(columns)
+
+        # One clock read for the whole render
+        now_ts = (now or datetime.now()).timestamp()
+
+        # Graph parts and connectors only depend on a few node fields, so
+        # each distinct one is built once per render
+        self._graph_part_cache = {}
+        self._connector_cache = {}
 
         # Render each commit
-        for i, node in enumerate(nodes):
+        last = len(table) - 1
+        for i, node in enumerate(table.nodes):
             # Build the graph part (left side with dots and lines)
-            graph_part = self._build_graph_part(node, nodes, i, max_column)
+            graph_part = self._build_graph_part(columns[i], is_head[i], max_column)
 
             # Build the info part (right side with message)
-            info_part = self._build_info_part(node, width - len(graph_part) - 2)
+            info_part = self._build_info_part(table, i, width - len(graph_part) - 2, now_ts)
 
             # Combine
             line_text = f"{graph_part}  {info_part}"
 
-            lines.append(GraphLine(line_text, node, True))
+            yield GraphLine(line_text, node, True)
 
             # Add connection lines between commits if needed
-            if i < len(nodes) - 1:
-                next_node = nodes[i + 1]
-                connector_lines = self._build_connector_lines(
-                    node, next_node, max_column
-                )
+            if i < last:
+                connector_lines = self._build_connector_lines(columns[i], max_column)
                 for conn_line in connector_lines:
-                    lines.append(GraphLine(conn_line, None, False))
+                    yield GraphLine(conn_line, None, False)
 
-        return lines
-
-    def _build_graph_part(
-        self, node: CommitNode, all_nodes: List[CommitNode], index: int, max_column: int
-    ) -> str:
+    def _build_graph_part(self, column: int, is_head: int, max_column: int) -> str:
         """Build the left graph part showing the tree structure."""
-        parts = []
-
-        # Build columns
-        for col in range(max_column + 1):
-            if col == node.column:
-                # This is the commit's column
-                if node.is_head:
-                    parts.append(self.CURRENT)
-                else:
-                    parts.append(self.COMMIT)
-            else:
-                # Check if we need a line here for another branch
-                parts.append(" ")
-
-        return " ".join(parts)
-
-    def _build_info_part(self, node: CommitNode, max_width: int) -> str:
+        key = (max_column, column, bool(is_head))
+        graph_part = self._graph_part_cache.get(key)
+        if graph_part is None:
+            # Blank columns joined by single spaces, with the commit symbol
+            # in this commit's column
+            blank = " " * (2 * max_column + 1)
+            offset = 2 * column
+            symbol = self.CURRENT if is_head else self.COMMIT
+            graph_part = blank[:offset] + symbol + blank[offset + 1:]
+            self._graph_part_cache[key] = graph_part
+        return graph_part
+
+    def _build_info_part(
+        self, table: CommitTable, index: int, max_width: int, now_ts: float
+    ) -> str:
         """Build the right info part with commit details."""
-        parts = []
-
-        # SHA
-        parts.append(f"[{node.short_sha}]")
-
-        # Branches
-        if node.branches:
-            for branch in node.branches:
-                parts.append(f"({branch})")
+        node = table.nodes[index]
 
-        # Tags
-        if node.tags:
-            for tag in node.tags:
-                parts.append(f"<{tag}>")
+        # Branches and tags, each with a leading space
+        branches = "".join(f" ({branch})" for branch in node.branches) if node.branches else ""
+        tags = "".join(f" <{tag}>" for tag in node.tags) if node.tags else ""
 
-        # Message
-        message = node.message.split("\n")[0]  # First line only
-        parts.append(message[:60])  # Truncate if too long
+        # Message: first line only, truncated if too long
+        message = table.messages[index]
+        newline = message.find("\n")
+        if newline >= 0:
+            message = message[:newline]
 
-        # Author and age
-        parts.append(f"- {node.author} {node.age}")
-
-        info = " ".join(parts)
+        author = table.authors[index]
+        age = _format_age_seconds(now_ts - table.timestamps[index])
+        info = f"[{table.short_shas[index]}]{branches}{tags} {message[:60]} - {author} {age}"
 
         # Truncate to max width
         if len(info) > max_width:
@@ -313,33 +536,44 @@ class GitGraph:
 
         return info
 
-    def _build_connector_lines(
-        self, current: CommitNode, next_node: CommitNode, max_column: int
-    ) -> List[str]:
+    def _build_connector_lines(self, column: int, max_column: int) -> List[str]:
         """Build connector lines between commits."""
-        lines = []
-
-        # Simple vertical line for now
-        parts = []
-        for col in range(max_column + 1):
-            if col == current.column:
-                parts.append(self.LINE)
-            else:
-                parts.append(" ")
-
-        lines.append(" ".join(parts))
-
+        key = (max_column, column)
+        lines = self._connector_cache.get(key)
+        if lines is None:
+            # Simple vertical line for now: blank columns joined by single
+            # spaces, with the line character in the current column's cell
+            blank = " " * (2 * max_column + 1)
+            offset = 2 * column
+            lines = [blank[:offset] + self.LINE + blank[offset + 1:]]
+            self._connector_cache[key] = lines
         return lines
 
     def get_node_by_sha(self, nodes: List[CommitNode], sha: str) -> Optional[CommitNode]:
         """Find a node by SHA (full or short)."""
+        if nodes is not self._indexed_nodes:
+            self._index_nodes(nodes)
+
+        node = self._sha_index.get(sha) or self._short_sha_index.get(sha)
+        if node is not None or len(sha) >= 40:
+            return node
+
+        # Arbitrary-length prefix: fall back to a scan
         for node in nodes:
-            if node.sha.startswith(sha) or node.short_sha == sha:
+            if node.sha.startswith(sha):
                 return node
         return None
 
     def get_node_index(self, nodes: List[CommitNode], node: CommitNode) -> int:
         """Get the index of a node in the list."""
+        if nodes is not self._indexed_nodes:
+            self._index_nodes(nodes)
+
+        index = self._position_index.get(id(node))
+        if index is not None:
+            return index
+
+        # Not this exact object; fall back to an equality scan
         try:
             return nodes.index(node)
         except ValueError:
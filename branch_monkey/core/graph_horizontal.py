@@ -1,11 +1,19 @@
 """Horizontal Git graph visualization - time flows left to right."""
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Set
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Set
 from pathlib import Path
 import git
 from git.exc import InvalidGitRepositoryError
 from datetime import datetime
+import heapq
+
+
+# Branches always shown on the first rows
+_MAIN_BRANCHES = frozenset({"main", "master"})
+
+# git log format for graph nodes: sha, parents, commit time, author, raw message
+_LOG_FORMAT = "%H%x1f%P%x1f%ct%x1f%an%x1f%B"
 
 
 @dataclass
@@ -84,6 +92,12 @@ class HorizontalGitGraph:
                 f"{self.repo_path} is not a Git repository."
             )
 
+        # Results of the last build_graph call, reused when rendering it
+        self._nodes: Optional[List[CommitNode]] = None
+        self._node_map: Dict[str, CommitNode] = {}  # sha -> node
+        self._branches: Optional[Dict[str, List[CommitNode]]] = None
+        self._sorted_branches: List[str] = []
+
     def build_graph(self, limit: int = 30) -> Tuple[List[CommitNode], Dict[str, List[CommitNode]]]:
         """
         Build the commit graph with horizontal layout.
@@ -94,47 +108,65 @@ class HorizontalGitGraph:
         Returns:
             Tuple of (all nodes, nodes by branch)
         """
-        nodes = []
-        node_map = {}  # sha -> node
-
         # Get HEAD commit SHA
         try:
             head_sha = self.repo.head.commit.hexsha
         except Exception:
             head_sha = None
 
-        # Get all branches
+        # Get all branch tips
+        branch_tips = {branch.name: branch.commit.hexsha for branch in self.repo.branches}
+
+        # Load the history once for every ref instead of once per branch
+        all_nodes = []  # newest first
+        max_count = limit * max(len(branch_tips), 1)
+        for fields in self._raw_iter_commits("--all", max_count):
+            all_nodes.append(self._make_node(fields, head_sha))
+
+        # Attribute commits to branches by walking parents in memory. Popping
+        # the newest pending commit first reproduces the order (and the
+        # limit cut-off) of a per-branch iter_commits walk.
+        position = {node.sha: i for i, node in enumerate(all_nodes)}
         branches = {}  # branch_name -> list of commits
-        for branch in self.repo.branches:
+        walked_separately = False
+        for branch_name, tip_sha in branch_tips.items():
             branch_commits = []
-            for commit in self.repo.iter_commits(branch.name, max_count=limit):
-                sha = commit.hexsha
-
-                # Create or update node
-                if sha not in node_map:
-                    node = CommitNode(
-                        sha=sha,
-                        short_sha=sha[:7],
-                        message=commit.message.strip(),
-                        author=commit.author.name,
-                        timestamp=datetime.fromtimestamp(commit.committed_date),
-                        parents=[p.hexsha for p in commit.parents],
-                        children=[],
-                        branches=[],
-                        tags=[],
-                        is_head=(sha == head_sha),
-                        is_merge=(len(commit.parents) > 1),
-                    )
-                    node_map[sha] = node
-                    nodes.append(node)
-
-                # Add branch to this commit
-                if branch.name not in node_map[sha].branches:
-                    node_map[sha].branches.append(branch.name)
-
-                branch_commits.append(node_map[sha])
-
-            branches[branch.name] = branch_commits
+            complete = tip_sha in position
+            if complete:
+                pending = [position[tip_sha]]
+                seen = {tip_sha}
+                while pending and len(branch_commits) < limit:
+                    node = all_nodes[heapq.heappop(pending)]
+                    branch_commits.append(node)
+                    for parent_sha in node.parents:
+                        if parent_sha not in position:
+                            # History continues past the loaded window
+                            complete = False
+                        elif parent_sha not in seen:
+                            seen.add(parent_sha)
+                            heapq.heappush(pending, position[parent_sha])
+
+            if not complete and len(branch_commits) < limit:
+                # Stale branch that fell outside the shared walk
+                walked_separately = True
+                branch_commits = []
+                for fields in self._raw_iter_commits(branch_name, limit):
+                    sha = fields[0]
+                    if sha not in position:
+                        position[sha] = len(all_nodes)
+                        all_nodes.append(self._make_node(fields, head_sha))
+                    branch_commits.append(all_nodes[position[sha]])
+
+            for node in branch_commits:
+                node.branches.append(branch_name)
+            branches[branch_name] = branch_commits
+
+        # Keep only commits that belong to a local branch (newest first)
+        nodes = [node for node in all_nodes if node.branches]
+        if walked_separately:
+            # Separately walked commits were appended out of order
+            nodes.sort(key=lambda n: n.timestamp, reverse=True)
+        node_map = {node.sha: node for node in nodes}
 
         # Build parent-child relationships
         for node in nodes:
@@ -143,49 +175,125 @@ class HorizontalGitGraph:
                     node_map[parent_sha].children.append(node.sha)
 
         # Get tags
-        for tag in self.repo.tags:
-            sha = tag.commit.hexsha
-            if sha in node_map:
-                node_map[sha].tags.append(tag.name)
+        for sha, tag_name in self._read_tags(node_map.keys()):
+            node_map[sha].tags.append(tag_name)
 
         # Assign positions (row and column)
-        self._assign_positions(branches, node_map)
+        self._nodes = nodes
+        self._node_map = node_map
+        self._branches = branches
+        self._sorted_branches = self._sort_branches(branches)
+        self._assign_positions(branches, nodes)
 
         return nodes, branches
 
-    def _assign_positions(self, branches: Dict[str, List[CommitNode]], node_map: Dict[str, CommitNode]) -> None:
+    def _raw_iter_commits(
+        self, rev: str, limit: int
+    ) -> Iterator[Tuple[str, List[str], int, str, str]]:
+        """
+        Read commit fields with a single git log call.
+
+        Avoids GitPython parsing each commit object again for every
+        attribute (message, author, date, parents) we touch.
+
+        Args:
+            rev: Revision to walk from (a branch name or "--all")
+            limit: Maximum number of commits
+
+        Yields:
+            (sha, parent_shas, committed_date, author, message) tuples
+        """
+        output = self.repo.git.log(rev, f"-n{limit}", f"--format={_LOG_FORMAT}", "-z", "--")
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            sha, parents, committed_date, author, message = record.split("\x1f", 4)
+            yield sha, parents.split(), int(committed_date), author, message.strip()
+
+    def _read_tags(self, commit_shas: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        List the tags that point at any of the given commits.
+
+        Reads every tag with one for-each-ref call instead of loading each
+        tag's commit object through GitPython.
+
+        Args:
+            commit_shas: SHAs of the loaded commits
+
+        Returns:
+            List of (commit sha, tag name) pairs
+        """
+        commit_shas = set(commit_shas)
+        if not commit_shas:
+            return []
+
+        # %(*objectname) is the peeled commit of an annotated tag (empty otherwise)
+        output = self.repo.git.for_each_ref(
+            "--format=%(objectname) %(*objectname) %(refname:strip=2)", "refs/tags/"
+        )
+        tags = []
+        for line in output.splitlines():
+            sha, peeled, name = line.split(" ", 2)
+            sha = peeled or sha
+            if sha in commit_shas:
+                tags.append((sha, name))
+        return tags
+
+    def _make_node(
+        self, fields: Tuple[str, List[str], int, str, str], head_sha: Optional[str]
+    ) -> CommitNode:
+        """Create a graph node from a _raw_iter_commits record."""
+        sha, parent_shas, committed_date, author, message = fields
+        return CommitNode(
+            sha=sha,
+            short_sha=sha[:7],
+            message=message,
+            author=author,
+            timestamp=datetime.fromtimestamp(committed_date),
+            parents=parent_shas,
+            children=[],
+            branches=[],
+            tags=[],
+            is_head=(sha == head_sha),
+            is_merge=(len(parent_shas) > 1),
+        )
+
+    def _assign_positions(self, branches: Dict[str, List[CommitNode]], nodes: List[CommitNode]) -> None:
         """
         Assign row (vertical) and column (horizontal) positions.
 
         Args:
             branches: Dictionary of branch name to list of commits
-            node_map: Dictionary of SHA to CommitNode
+            nodes: All commit nodes, newest first
         """
         # Assign rows (each branch gets a row)
         row_assignments = {}
         current_row = 0
 
-        # Sort branches: main/master first, then alphabetically
-        sorted_branches = sorted(branches.keys(), key=lambda b: (
-            b not in ['main', 'master'],  # main/master first
-            b
-        ))
-
-        for branch_name in sorted_branches:
+        for branch_name in self._sorted_branches_for(branches):
             row_assignments[branch_name] = current_row
             current_row += 1
 
-        # Assign columns based on timestamp (oldest = leftmost)
-        all_commits = list(node_map.values())
-        all_commits.sort(key=lambda n: n.timestamp)
-
-        for col, node in enumerate(all_commits):
+        # Assign columns based on time (oldest = leftmost). Nodes are already
+        # newest first, so walking them backwards needs no sort.
+        for col, node in enumerate(reversed(nodes)):
             node.col = col
             # Assign row based on primary branch
             if node.branches:
                 primary_branch = node.branches[0]
                 node.row = row_assignments.get(primary_branch, 0)
 
+    @staticmethod
+    def _sort_branches(branches: Dict[str, List[CommitNode]]) -> List[str]:
+        """Sort branch names: main/master first, then alphabetically."""
+        return sorted(branches, key=lambda b: (b not in _MAIN_BRANCHES, b))
+
+    def _sorted_branches_for(self, branches: Dict[str, List[CommitNode]]) -> List[str]:
+        """Get the row order for branches, reusing the one from build_graph."""
+        if branches is self._branches:
+            return self._sorted_branches
+        return self._sort_branches(branches)
+
     def render_graph(self, nodes: List[CommitNode], branches: Dict[str, List[CommitNode]], width: int = 120) -> List[str]:
         """
         Render the graph as ASCII art (horizontal).
@@ -201,38 +309,39 @@ class HorizontalGitGraph:
         if not nodes:
             return ["No commits yet"]
 
+        # For each row, also show branch name and commit info
+        sorted_branches = self._sorted_branches_for(branches)
+
         # Find dimensions
-        max_row = max(node.row for node in nodes)
+        max_row = max(max(node.row for node in nodes), len(sorted_branches) - 1)
         max_col = max(node.col for node in nodes)
 
-        # Create grid
-        grid = {}  # (row, col) -> character
+        # Create grid: one list of rendered cells per row
+        grid = [["  "] * (max_col + 1) for _ in range(max_row + 1)]
 
-        # Place commits
-        for node in nodes:
-            symbol = self.CURRENT if node.is_head else self.COMMIT
-            grid[(node.row, node.col)] = symbol
-
-        # Draw connections (horizontal lines between commits in same row)
+        # Draw connections (horizontal lines between commits in same row).
+        # Commits are placed afterwards, so they take precedence over lines.
+        line_fill = [self.HORIZONTAL] * max_col
+        if nodes is self._nodes:
+            node_map = self._node_map
+        else:
+            node_map = {node.sha: node for node in nodes}
         for node in nodes:
             # Connect to children in same row
             for child_sha in node.children:
-                child = next((n for n in nodes if n.sha == child_sha), None)
-                if child and child.row == node.row:
+                child = node_map.get(child_sha)
+                if child and child.row == node.row and child.col > node.col + 1:
                     # Draw horizontal line
-                    for c in range(node.col + 1, child.col):
-                        if (node.row, c) not in grid:
-                            grid[(node.row, c)] = self.HORIZONTAL
+                    grid[node.row][node.col + 1:child.col] = line_fill[:child.col - node.col - 1]
+
+        # Place commits (each followed by a line segment)
+        for node in nodes:
+            symbol = self.CURRENT if node.is_head else self.COMMIT
+            grid[node.row][node.col] = symbol + self.HORIZONTAL
 
         # Convert grid to strings
         lines = []
 
-        # For each row, also show branch name and commit info
-        sorted_branches = sorted(branches.keys(), key=lambda b: (
-            b not in ['main', 'master'],
-            b
-        ))
-
         for row_idx, branch_name in enumerate(sorted_branches):
             # Build the line for this row
             line_chars = []
@@ -242,24 +351,17 @@ class HorizontalGitGraph:
             line_chars.append(branch_label)
 
             # Graph part
-            for col in range(max_col + 1):
-                if (row_idx, col) in grid:
-                    char = grid[(row_idx, col)]
-                    line_chars.append(char)
-
-                    # Add space after commit
-                    if char in [self.COMMIT, self.CURRENT]:
-                        line_chars.append(self.HORIZONTAL)
-                    else:
-                        line_chars.append("")
-                else:
-                    line_chars.append("  ")
+            line_chars.extend(grid[row_idx])
 
             # Find commit info for this row/branch
             branch_commits = branches[branch_name]
             if branch_commits:
                 latest = branch_commits[0]  # Most recent
-                info = f"  {latest.short_sha} {latest.message[:40]}"
+                message = latest.message
+                newline = message.find("\n")
+                if newline >= 0:
+                    message = message[:newline]  # First line only
+                info = f"  {latest.short_sha} {message[:40]}"
                 line_chars.append(info)
 
             lines.append("".join(line_chars))
@@ -1,13 +1,40 @@
 """History navigation - visual timeline and diff viewing."""
 
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Dict, Tuple
 import git
 from git.exc import GitCommandError, InvalidGitRepositoryError
 
 
+# Commit fields read per history entry: SHA, parent SHAs, committer date, author, raw body
+_LOG_FORMAT = "%H%x1f%P%x1f%ct%x1f%an%x1f%B"
+
+# Diff options for batched file changes, with the root commit shown as all-added
+_CHANGES_ARGS = ("-M", "--raw", "--numstat", "--root")
+
+# Commits whose file changes are read before the first streamed entries are
+# yielded; later batches double in size, up to _MAX_HISTORY_BATCH
+_FIRST_HISTORY_BATCH = 16
+_MAX_HISTORY_BATCH = 256
+
+# Most commits whose file changes are kept in memory per navigator
+_CHANGES_CACHE_SIZE = 4096
+
+# Upper bound on threads reading branch histories in parallel
+_MAX_TIMELINE_WORKERS = min(10, os.cpu_count() or 4)
+
+# Diff status letters that map to something other than 'modified'
+_CHANGE_TYPES = {"A": "added", "D": "deleted", "R": "renamed"}
+
+
 @dataclass
 class FileChange:
     """A change to a single file."""
@@ -52,7 +79,7 @@ class HistoryEntry:
     sha: str
     message: str
     author: str
-    timestamp: datetime
+    committed_date: int  # Unix epoch seconds
     files_changed: List[FileChange]
     branch: Optional[str] = None
     tags: List[str] = None
@@ -67,23 +94,28 @@ class HistoryEntry:
         """Get short version of SHA."""
         return self.sha[:7]
 
+    @property
+    def timestamp(self) -> datetime:
+        """Commit time as a local datetime, built only when asked for."""
+        return datetime.fromtimestamp(self.committed_date)
+
     @property
     def age(self) -> str:
         """Human-readable age."""
-        delta = datetime.now() - self.timestamp
-        if delta.days > 365:
-            years = delta.days // 365
+        seconds = int(time.time()) - self.committed_date
+        if seconds >= 366 * 86400:
+            years = seconds // (365 * 86400)
             return f"{years}y"
-        elif delta.days > 30:
-            months = delta.days // 30
+        elif seconds >= 31 * 86400:
+            months = seconds // (30 * 86400)
             return f"{months}mo"
-        elif delta.days > 0:
-            return f"{delta.days}d"
-        elif delta.seconds > 3600:
-            hours = delta.seconds // 3600
+        elif seconds >= 86400:
+            return f"{seconds // 86400}d"
+        elif seconds > 3600:
+            hours = seconds // 3600
             return f"{hours}h"
-        elif delta.seconds > 60:
-            minutes = delta.seconds // 60
+        elif seconds > 60:
+            minutes = seconds // 60
             return f"{minutes}m"
         else:
             return "now"
@@ -125,6 +157,31 @@ class HistoryNavigator:
                 f"{self.repo_path} is not a Git repository. "
                 "Run 'git init' first to use Branch Monkey."
             )
+        # Commit SHA -> tag names, read on first use; cleared by refresh()
+        self._tags_by_sha: Optional[Dict[str, List[str]]] = None
+        # Commit SHA -> file changes, least recently used first. A commit's
+        # changes never change, so entries only leave when the cache is full.
+        self._changes_cache: "OrderedDict[str, List[FileChange]]" = OrderedDict()
+
+    def refresh(self) -> None:
+        """Drop cached repository state (tags) so the next read sees new refs."""
+        self._tags_by_sha = None
+
+    def write_commit_graph(self) -> None:
+        """
+        Write git's commit-graph file for the repository.
+
+        With a commit-graph, git log reads parents and dates without parsing
+        each commit object, and its changed-path Bloom filters let
+        path-limited logs skip commits that can't touch the paths. This
+        writes into .git and can take a while on large repositories, so it
+        only runs when asked for (`monkey commit-graph`), never from a read.
+
+        Raises:
+            GitCommandError: If git can't write the graph (e.g. too old for
+                --changed-paths, or a read-only repository)
+        """
+        self.repo.git.commit_graph("write", "--reachable", "--changed-paths")
 
     def get_history(
         self,
@@ -143,44 +200,108 @@ class HistoryNavigator:
         Returns:
             List of history entries, newest first
         """
-        entries = []
+        return list(self.iter_history(limit, branch, file_path))
 
-        # Build arguments for iter_commits
-        kwargs = {"max_count": limit}
-        if branch:
-            kwargs["rev"] = branch
-        if file_path:
-            kwargs["paths"] = file_path
+    def iter_history(
+        self,
+        limit: int = 50,
+        branch: Optional[str] = None,
+        file_path: Optional[str] = None,
+    ) -> Iterator[HistoryEntry]:
+        """
+        Iterate over project history, newest first.
 
-        # Iterate commits
-        for commit in self.repo.iter_commits(**kwargs):
-            # Get file changes
-            file_changes = self._get_file_changes(commit)
+        File changes are read in small batches as the iteration goes, so the
+        first entries are available without diffing every commit up to limit.
 
-            # Determine if merge commit
-            is_merge = len(commit.parents) > 1
+        Args:
+            limit: Maximum number of entries to yield
+            branch: Specific branch to show history for. If None, uses current branch.
+            file_path: If provided, only shows history for this file
 
-            # Get tags for this commit
-            tags = [tag.name for tag in self.repo.tags if tag.commit == commit]
+        Yields:
+            History entries, newest first
+        """
+        paths = [file_path] if file_path else []
+        return self._iter_history([branch or "HEAD"], limit, paths)
 
-            # Get branch (for current HEAD)
-            branch_name = None
-            try:
-                if commit == self.repo.head.commit:
-                    branch_name = self.repo.active_branch.name
-            except Exception:
-                pass
+    def _iter_history(
+        self, revs: List[str], limit: int, paths: Optional[List[str]] = None
+    ) -> Iterator[HistoryEntry]:
+        """
+        Yield history entries for the commits a git log selects.
 
+        Args:
+            revs: Revisions and git log options selecting the commits
+            limit: Maximum number of entries to yield
+            paths: If provided, only commits touching these paths
+
+        Yields:
+            History entries, newest first
+        """
+        commits = self._raw_iter_commits(revs, limit, paths)
+        batch_size = _FIRST_HISTORY_BATCH
+        while True:
+            batch = list(islice(commits, batch_size))
+            if not batch:
+                return
+            yield from self._build_entries(batch)
+            batch_size = min(batch_size * 2, _MAX_HISTORY_BATCH)
+
+    def _read_history(
+        self, revs: List[str], limit: int, paths: Optional[List[str]] = None
+    ) -> List[HistoryEntry]:
+        """
+        Build history entries for the commits a git log selects.
+
+        File changes come from the per-SHA cache, so revisiting commits only
+        costs the commit listing.
+
+        Args:
+            revs: Revisions and git log options selecting the commits
+            limit: Maximum number of entries to return
+            paths: If provided, only commits touching these paths
+
+        Returns:
+            List of history entries, newest first
+        """
+        return list(self._iter_history(revs, limit, paths))
+
+    def _build_entries(
+        self, commits: List[Tuple[str, List[str], int, str, str]]
+    ) -> List[HistoryEntry]:
+        """
+        Build history entries from raw commit fields.
+
+        Args:
+            commits: (sha, parent_shas, committed_date, author, message) tuples
+
+        Returns:
+            One history entry per commit, in the same order
+        """
+        entries = []
+
+        # Resolve HEAD and its branch once rather than for every commit
+        head_sha, head_branch = None, None
+        try:
+            head_sha = self.repo.head.commit.hexsha
+            head_branch = self.repo.active_branch.name
+        except Exception:
+            pass
+
+        tags_by_sha = self._get_tags_by_sha()
+        changes_by_sha = self._get_changes_by_sha([commit[0] for commit in commits])
+        for sha, parents, committed_date, author, message in commits:
             entries.append(
                 HistoryEntry(
-                    sha=commit.hexsha,
-                    message=commit.message.strip(),
-                    author=commit.author.name,
-                    timestamp=datetime.fromtimestamp(commit.committed_date),
-                    files_changed=file_changes,
-                    branch=branch_name,
-                    tags=tags,
-                    is_merge=is_merge,
+                    sha=sha,
+                    message=message,
+                    author=author,
+                    committed_date=committed_date,
+                    files_changed=list(changes_by_sha[sha]),
+                    branch=head_branch if sha == head_sha else None,
+                    tags=list(tags_by_sha.get(sha, ())),
+                    is_merge=len(parents) > 1,
                 )
             )
 
@@ -193,14 +314,33 @@ class HistoryNavigator:
         Returns:
             Dictionary mapping branch names to their histories
         """
-        timeline = {}
-
-        for branch in self.repo.branches:
-            # Get history for this branch (limit to recent commits)
-            history = self.get_history(limit=20, branch=branch.name)
-            timeline[branch.name] = history
-
-        return timeline
+        branch_names = [branch.name for branch in self.repo.branches]
+        if not branch_names:
+            return {}
+
+        # GitPython repos are not thread-safe, so each worker thread reads
+        # through its own navigator (and git.Repo) sharing this one's tag map
+        tags_by_sha = self._get_tags_by_sha()
+        local = threading.local()
+        navigators = []
+
+        def branch_history(branch_name: str) -> List[HistoryEntry]:
+            navigator = getattr(local, "navigator", None)
+            if navigator is None:
+                navigator = local.navigator = HistoryNavigator(Path(self.repo.working_dir))
+                navigator._tags_by_sha = tags_by_sha
+                navigators.append(navigator)
+            # Limit to recent commits
+            return navigator.get_history(limit=20, branch=branch_name)
+
+        workers = min(_MAX_TIMELINE_WORKERS, len(branch_names))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(branch_names, executor.map(branch_history, branch_names)))
+        finally:
+            # Stop the git helper processes each worker repo started
+            for navigator in navigators:
+                navigator.repo.close()
 
     def get_diff(self, entry: HistoryEntry, file_path: Optional[str] = None) -> str:
         """
@@ -219,7 +359,7 @@ class HistoryNavigator:
             # If no parent, this is first commit
             if not commit.parents:
                 if file_path:
-                    return self.repo.git.show(f"{entry.sha}:{file_path}")
+                    return self._cat(f"{entry.sha}:{file_path}")
                 else:
                     return self.repo.git.show(entry.sha)
 
@@ -234,6 +374,22 @@ class HistoryNavigator:
         except Exception as e:
             raise GitCommandError("git diff", f"Failed to get diff: {e}")
 
+    def get_merge_changes(self, sha: str) -> List[FileChange]:
+        """
+        Get a merge commit's file changes against its first parent.
+
+        History listings leave merge commits without file changes; this
+        computes them when they're actually wanted.
+
+        Args:
+            sha: Merge commit SHA
+
+        Returns:
+            File changes brought in by the merge
+        """
+        parents = self.repo.git.rev_list("--parents", "-n1", sha).split()[1:]
+        return self._get_file_changes(sha, parents)
+
     def search_history(
         self, query: str, search_in: str = "message", limit: int = 50
     ) -> List[HistoryEntry]:
@@ -243,41 +399,29 @@ class HistoryNavigator:
         Args:
             query: Search query
             search_in: What to search in ('message', 'author', 'content')
-            limit: Maximum number of results
+            limit: Maximum number of results (the first matches, newest first)
 
         Returns:
             Matching history entries
         """
+        # git does the case-insensitive substring match, so only matching
+        # commits get their file changes read; limit counts matches
         if search_in == "message":
             # Search in commit messages
-            entries = self.get_history(limit=limit)
-            return [e for e in entries if query.lower() in e.message.lower()]
+            return self._read_history(
+                ["HEAD", f"--grep={query}", "--regexp-ignore-case", "--fixed-strings"], limit
+            )
 
         elif search_in == "author":
-            # Search by author
-            entries = self.get_history(limit=limit)
-            return [e for e in entries if query.lower() in e.author.lower()]
+            # Search by author (git matches "Name <email>")
+            return self._read_history(
+                ["HEAD", f"--author={query}", "--regexp-ignore-case", "--fixed-strings"], limit
+            )
 
         elif search_in == "content":
             # Search in commit content (pickaxe)
             try:
-                commits = list(
-                    self.repo.iter_commits(max_count=limit, all=True, G=query)
-                )
-                entries = []
-                for commit in commits:
-                    file_changes = self._get_file_changes(commit)
-                    entries.append(
-                        HistoryEntry(
-                            sha=commit.hexsha,
-                            message=commit.message.strip(),
-                            author=commit.author.name,
-                            timestamp=datetime.fromtimestamp(commit.committed_date),
-                            files_changed=file_changes,
-                            is_merge=len(commit.parents) > 1,
-                        )
-                    )
-                return entries
+                return self._read_history(["--all", f"-G{query}"], limit)
             except Exception:
                 return []
 
@@ -294,7 +438,81 @@ class HistoryNavigator:
         Returns:
             History entries that modified this file
         """
-        return self.get_history(limit=limit, file_path=file_path)
+        return self.get_files_history([file_path], limit)[file_path]
+
+    def get_files_history(
+        self, paths: List[str], limit: int = 20
+    ) -> Dict[str, List[HistoryEntry]]:
+        """
+        Get history for several files with a single commit walk.
+
+        Args:
+            paths: Paths to files or directories (relative to repo root)
+            limit: Maximum number of entries per path
+
+        Returns:
+            Dictionary mapping each path to the history entries that modified it
+        """
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return {}
+
+        # One walk over all paths, listing the touched files of each commit.
+        # --no-renames lists both sides of a rename so the old path matches too.
+        walk_limit = limit * len(paths)
+        output = self.repo.git.log(
+            "HEAD",
+            f"-n{walk_limit}",
+            f"--format=%x1e{_LOG_FORMAT}",
+            "-z",
+            "--name-only",
+            "--no-renames",
+            "--",
+            *paths,
+        )
+
+        commits = []
+        positions: Dict[str, List[int]] = {path: [] for path in paths}
+        prefixes = [(path, path.rstrip("/") + "/") for path in paths]
+        for record in output.split("\x1e"):
+            if not record:
+                continue
+            header, _, names = record.partition("\x00")
+            sha, parents, committed_date, author, message = header.split("\x1f", 4)
+            parents = parents.split()
+            if len(parents) > 1:
+                # git log lists no files for merges. Like git's own path
+                # history, a merge counts for a path only if it differs
+                # from every parent there.
+                touched_per_parent = [
+                    self.repo.git.diff_tree(
+                        "-r", "--name-only", "--no-renames", "-z", parent, sha, "--", *paths
+                    ).split("\x00")
+                    for parent in parents
+                ]
+            else:
+                touched_per_parent = [names.lstrip("\n").split("\x00")]
+
+            index = len(commits)
+            commits.append((sha, parents, int(committed_date), author, message.strip()))
+            for path, prefix in prefixes:
+                if len(positions[path]) < limit and all(
+                    any(name == path or name.startswith(prefix) for name in touched)
+                    for touched in touched_per_parent
+                ):
+                    positions[path].append(index)
+
+        entries = self._build_entries(commits)
+        history = {path: [entries[i] for i in positions[path]] for path in paths}
+
+        # A capped walk can run out before reaching a rarely-touched path's
+        # older commits; walk those paths on their own
+        if len(commits) == walk_limit:
+            for path in paths:
+                if len(history[path]) < limit:
+                    history[path] = self._read_history(["HEAD"], limit, [path])
+
+        return history
 
     def compare_commits(
         self, sha1: str, sha2: str
@@ -313,107 +531,188 @@ class HistoryNavigator:
             # Get diff
             diff_text = self.repo.git.diff(sha1, sha2)
 
-            # Get file changes
-            commit1 = self.repo.commit(sha1)
-            commit2 = self.repo.commit(sha2)
-
-            # Get diff stats
-            diff_index = commit1.diff(commit2)
-
-            file_changes = []
-            for diff_item in diff_index:
-                change_type = "modified"
-                old_path = None
-
-                if diff_item.new_file:
-                    change_type = "added"
-                elif diff_item.deleted_file:
-                    change_type = "deleted"
-                elif diff_item.renamed_file:
-                    change_type = "renamed"
-                    old_path = diff_item.rename_from
-
-                # Try to get line counts (may not always be available)
-                insertions = 0
-                deletions = 0
-                if hasattr(diff_item, "diff"):
-                    diff_str = diff_item.diff.decode("utf-8", errors="ignore")
-                    for line in diff_str.split("\n"):
-                        if line.startswith("+") and not line.startswith("+++"):
-                            insertions += 1
-                        elif line.startswith("-") and not line.startswith("---"):
-                            deletions += 1
-
-                file_changes.append(
-                    FileChange(
-                        path=diff_item.b_path or diff_item.a_path,
-                        change_type=change_type,
-                        insertions=insertions,
-                        deletions=deletions,
-                        old_path=old_path,
-                    )
-                )
+            # File changes with git's own line counts; no diff text is scanned
+            file_changes = _parse_file_changes(
+                self.repo.git.diff("-M", "--raw", "--numstat", "-z", sha1, sha2)
+            )
 
             return file_changes, diff_text
 
         except Exception as e:
             raise GitCommandError("git diff", f"Failed to compare commits: {e}")
 
-    def _get_file_changes(self, commit: git.Commit) -> List[FileChange]:
-        """Get file changes for a commit."""
-        file_changes = []
-
-        # If no parent, this is the first commit
-        if not commit.parents:
-            # Show all files as added
-            for item in commit.tree.traverse():
-                if item.type == "blob":  # It's a file
-                    file_changes.append(
-                        FileChange(
-                            path=item.path,
-                            change_type="added",
-                        )
-                    )
-            return file_changes
-
-        # Get diff with parent
-        parent = commit.parents[0]
-        diffs = parent.diff(commit)
-
-        for diff_item in diffs:
-            change_type = "modified"
-            old_path = None
-
-            if diff_item.new_file:
-                change_type = "added"
-            elif diff_item.deleted_file:
-                change_type = "deleted"
-            elif diff_item.renamed_file:
-                change_type = "renamed"
-                old_path = diff_item.rename_from
-
-            # Try to count lines (may not always work)
-            insertions = 0
-            deletions = 0
-            try:
-                if hasattr(diff_item, "diff") and diff_item.diff:
-                    diff_str = diff_item.diff.decode("utf-8", errors="ignore")
-                    for line in diff_str.split("\n"):
-                        if line.startswith("+") and not line.startswith("+++"):
-                            insertions += 1
-                        elif line.startswith("-") and not line.startswith("---"):
-                            deletions += 1
-            except Exception:
-                pass
-
-            file_changes.append(
-                FileChange(
-                    path=diff_item.b_path or diff_item.a_path,
-                    change_type=change_type,
-                    insertions=insertions,
-                    deletions=deletions,
-                    old_path=old_path,
-                )
+    def _cat(self, spec: str) -> str:
+        """
+        Read an object's content through GitPython's persistent ``cat-file --batch``.
+
+        Avoids spawning a new git process for every object read.
+
+        Args:
+            spec: Object spec, e.g. ``<sha>`` or ``<sha>:<path>``
+
+        Returns:
+            Object content as text, without the trailing newline (like ``git show``)
+        """
+        _, _, _, data = self.repo.git.get_object_data(spec)
+        text = data.decode("utf-8", errors="replace")
+        return text[:-1] if text.endswith("\n") else text
+
+    def _get_tags_by_sha(self) -> Dict[str, List[str]]:
+        """
+        Map commit SHAs to the names of the tags pointing at them.
+
+        Built once with a single for-each-ref call so per-commit tag lookup
+        is a dict hit rather than a scan over every tag.
+        """
+        if self._tags_by_sha is None:
+            tags_by_sha = defaultdict(list)
+            # %(*objectname) is the peeled commit of an annotated tag (empty otherwise)
+            output = self.repo.git.for_each_ref(
+                "--format=%(objectname) %(*objectname) %(refname:strip=2)", "refs/tags/"
             )
+            for line in output.splitlines():
+                sha, peeled, name = line.split(" ", 2)
+                tags_by_sha[peeled or sha].append(name)
+            self._tags_by_sha = dict(tags_by_sha)
+        return self._tags_by_sha
+
+    def _raw_iter_commits(
+        self, revs: List[str], limit: int, paths: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, List[str], int, str, str]]:
+        """
+        Read commit fields with a single git log call.
+
+        Avoids GitPython parsing each commit object again for every
+        attribute (message, author, date, parents) we touch.
 
-        return file_changes
+        Yields:
+            (sha, parent_shas, committed_date, author, message) tuples
+        """
+        output = self.repo.git.log(
+            *revs,
+            f"-n{limit}",
+            f"--format={_LOG_FORMAT}",
+            "-z",
+            "--",
+            *(paths or []),
+        )
+        for record in output.split("\x00"):
+            if not record:
+                continue
+            sha, parents, committed_date, author, message = record.split("\x1f", 4)
+            yield sha, parents.split(), int(committed_date), author, message.strip()
+
+    def _get_changes_by_sha(self, shas: List[str]) -> Dict[str, List[FileChange]]:
+        """
+        Get file changes for each commit, diffing only the ones not cached yet.
+
+        The misses are read together with one git log call.
+
+        Args:
+            shas: Full commit SHAs
+
+        Returns:
+            Dictionary mapping each SHA to its file changes
+        """
+        cache = self._changes_cache
+        changes_by_sha = {}
+        missing = []
+        for sha in shas:
+            file_changes = cache.get(sha)
+            if file_changes is None:
+                missing.append(sha)
+            else:
+                cache.move_to_end(sha)
+                changes_by_sha[sha] = file_changes
+
+        if missing:
+            for sha, file_changes in self._read_file_changes(missing):
+                changes_by_sha[sha] = cache[sha] = file_changes
+            while len(cache) > _CHANGES_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return changes_by_sha
+
+    def _read_file_changes(self, shas: List[str]) -> Iterator[Tuple[str, List[FileChange]]]:
+        """
+        Read the file changes of the given commits with a single git log call.
+
+        Rename status and per-file line counts come from ``--raw --numstat`` in
+        the same stream, so there is no per-commit diff subprocess. Merge
+        diffs are costly and rarely needed in a listing, so merges get no
+        file changes here; use get_merge_changes() for them on demand.
+
+        Yields:
+            (sha, file_changes) tuples
+        """
+        # --no-walk shows exactly the listed commits (-n would make it walk).
+        # Each commit starts with \x1e; its header ends at the first NUL and
+        # the -z diff records for that commit follow up to the next \x1e.
+        output = self.repo.git.log(
+            "--no-walk=unsorted",
+            "--format=%x1e%H%x1f%P",
+            "-z",
+            *_CHANGES_ARGS,
+            *shas,
+            "--",
+        )
+        for record in output.split("\x1e"):
+            if not record:
+                continue
+            header, _, changes = record.partition("\x00")
+            sha, parents = header.split("\x1f")
+            parents = parents.split()
+            if len(parents) > 1:
+                yield sha, []
+            else:
+                yield sha, _parse_file_changes(changes.lstrip("\n"))
+
+    def _get_file_changes(self, sha: str, parents: List[str]) -> List[FileChange]:
+        """Get file changes for a single commit against its first parent."""
+        # A root commit is diffed against the empty tree, so every file shows as added
+        revs = [parents[0], sha] if parents else ["--root", sha]
+        output = self.repo.git.diff_tree(
+            "-r", "-M", "--raw", "--numstat", "-z", "--no-commit-id", *revs
+        )
+        return _parse_file_changes(output)
+
+
+def _parse_file_changes(output: str) -> List[FileChange]:
+    """
+    Parse ``git diff-tree --raw --numstat -z`` output into file changes.
+
+    Line counts come from git's own numstat, so no diff text is decoded.
+    """
+    tokens = output.split("\x00")
+    file_changes = []
+    i = 0
+
+    # --raw records: ":<modes> <blobs> <status>", then the path (old and new path for renames)
+    while i < len(tokens) and tokens[i].startswith(":"):
+        status = tokens[i].rsplit(" ", 1)[1][:1]
+        if status in ("R", "C"):
+            old_path, path = tokens[i + 1], tokens[i + 2]
+            i += 3
+        else:
+            old_path, path = None, tokens[i + 1]
+            i += 2
+        file_changes.append(
+            FileChange(
+                path=path,
+                change_type=_CHANGE_TYPES.get(status, "modified"),
+                old_path=old_path if status == "R" else None,
+            )
+        )
+
+    # --numstat records follow in the same order; renames leave the path empty
+    # and list old and new path as separate tokens. Binary files count as "-".
+    for change in file_changes:
+        if i >= len(tokens):
+            break
+        insertions, deletions, path = tokens[i].split("\t", 2)
+        i += 1 if path else 3
+        if insertions != "-":
+            change.insertions = int(insertions)
+            change.deletions = int(deletions)
+
+    return file_changes
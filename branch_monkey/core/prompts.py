@@ -3,20 +3,55 @@
 import os
 import sqlite3
 import json
+import threading
+import time
+import uuid
+import warnings
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Tuple, Set, Iterator
 from dataclasses import dataclass, asdict
 
+# Optional faster JSON for prompt metadata; falls back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# File locks that keep queue appends and drains apart (POSIX only)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 # Per-repo database filename (stored in <repo>/.branch_monkey/data.db)
 LOCAL_DB_NAME = "data.db"
 
 
+# Per-repo queue of prompts logged by hooks, waiting to be written to the database
+PROMPT_QUEUE_NAME = "prompt_queue.jsonl"
+
+# A drain claims the queue by renaming it to
+# "<queue>.<pid>.<claimed at, ns>.<random>.draining". Claims of this process's
+# drains that are still running, so other drains leave them alone:
+_active_claims: Set[str] = set()
+_active_claims_lock = threading.Lock()
+
+# Another process's claim this old was left by a drain that died before finishing
+_ABANDONED_CLAIM_SECONDS = 60
+
+
 def get_local_db_path(repo_path: Path) -> Path:
     """Get the path to a repo's local database."""
     return repo_path / ".branch_monkey" / LOCAL_DB_NAME
 
+
+def get_prompt_queue_path(repo_path: Path) -> Path:
+    """Get the path to a repo's queue of prompts waiting to be logged."""
+    return repo_path / ".branch_monkey" / PROMPT_QUEUE_NAME
+
 # Known providers and their pricing (per 1M tokens as of late 2024)
 PROVIDER_PRICING = {
     "anthropic": {
@@ -39,6 +74,38 @@ PROVIDER_PRICING = {
     }
 }
 
+# PROVIDER_PRICING flattened once at import: (provider, model) -> (input rate, output rate)
+_PRICE_TABLE: Dict[Tuple[str, str], Tuple[float, float]] = {
+    (provider.lower(), model.lower()): (rates["input"], rates["output"])
+    for provider, models in PROVIDER_PRICING.items()
+    for model, rates in models.items()
+}
+
+# Provider -> [(model, rates)] in table order, for partial model-name matches
+_PROVIDER_MODELS: Dict[str, List[Tuple[str, Tuple[float, float]]]] = {}
+for (_provider, _model), _rates_pair in _PRICE_TABLE.items():
+    _PROVIDER_MODELS.setdefault(_provider, []).append((_model, _rates_pair))
+
+
+# Longest preview stored before truncation
+_PREVIEW_CHARS = 500
+
+# Insert for one prompt_logs row; parameters follow _prompt_log_row().
+# Previews go to prompt_previews, so the prompt_logs columns stay NULL.
+_INSERT_PROMPT_SQL = """
+    INSERT INTO prompt_logs (
+        timestamp, provider, model,
+        input_tokens, output_tokens, total_tokens, cost, duration,
+        status, error_message, session_id, user, tool_name, metadata
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PREVIEW_SQL = """
+    INSERT INTO prompt_previews (prompt_id, prompt_preview, response_preview)
+    VALUES (?, ?, ?)
+"""
+
 
 @dataclass
 class PromptLog:
@@ -68,6 +135,17 @@ def init_prompts_db(repo_path: Path):
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(db_path)
+    # page_size only takes effect before the first write to a new database
+    conn.execute("PRAGMA page_size=8192")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    _create_prompts_schema(conn)
+    conn.commit()
+    conn.close()
+
+
+def _create_prompts_schema(conn: sqlite3.Connection):
+    """Create the prompt_logs and prompt_previews tables and indexes if they don't exist."""
     conn.execute('''
         CREATE TABLE IF NOT EXISTS prompt_logs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -89,42 +167,73 @@ def init_prompts_db(repo_path: Path):
             metadata TEXT
         )
     ''')
+    # The large preview texts live in their own table so listing and stats
+    # queries scan narrow prompt_logs rows. prompt_logs keeps its preview
+    # columns for rows written before the split (and by older writers).
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS prompt_previews (
+            prompt_id INTEGER PRIMARY KEY REFERENCES prompt_logs(id) ON DELETE CASCADE,
+            prompt_preview TEXT,
+            response_preview TEXT
+        )
+    ''')
     conn.execute('''
         CREATE INDEX IF NOT EXISTS idx_prompt_logs_timestamp
         ON prompt_logs(timestamp DESC)
     ''')
+    # Filter column + timestamp, so get_prompts' filtered queries can both
+    # filter and order from one index instead of scanning the table
     conn.execute('''
-        CREATE INDEX IF NOT EXISTS idx_prompt_logs_session
-        ON prompt_logs(session_id)
+        CREATE INDEX IF NOT EXISTS idx_prompt_logs_session_ts
+        ON prompt_logs(session_id, timestamp DESC)
     ''')
-    conn.commit()
-    conn.close()
+    conn.execute('DROP INDEX IF EXISTS idx_prompt_logs_session')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prompt_logs_provider_ts
+        ON prompt_logs(provider, timestamp DESC)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prompt_logs_status_ts
+        ON prompt_logs(status, timestamp DESC)
+    ''')
+    # Errors are rare; a partial index keeps counting them cheap
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_prompt_logs_errors
+        ON prompt_logs(timestamp DESC)
+        WHERE status = 'error'
+    ''')
+
+
+@lru_cache(maxsize=4096)
+def _get_rates(provider: str, model: str) -> Optional[Tuple[float, float]]:
+    """(input, output) rates per 1M tokens for a lowercased provider and model."""
+    # Try exact match first
+    rates = _PRICE_TABLE.get((provider, model))
+    if rates is not None:
+        return rates
+
+    models = _PROVIDER_MODELS.get(provider)
+    if not models:
+        return None
+
+    # Try partial match
+    for model_key, rates in models:
+        if model_key in model or model in model_key:
+            return rates
+
+    # Default to most common model pricing
+    return models[0][1]
 
 
 def calculate_cost(provider: str, model: str, input_tokens: int, output_tokens: int) -> float:
     """Calculate the cost of a prompt based on provider pricing."""
-    provider_lower = provider.lower()
-    model_lower = model.lower()
-
-    if provider_lower in PROVIDER_PRICING:
-        pricing = PROVIDER_PRICING[provider_lower]
-        # Try exact match first
-        if model_lower in pricing:
-            rates = pricing[model_lower]
-        else:
-            # Try partial match
-            for model_key, rates in pricing.items():
-                if model_key in model_lower or model_lower in model_key:
-                    break
-            else:
-                # Default to most common model pricing
-                rates = list(pricing.values())[0]
-
-        input_cost = (input_tokens / 1_000_000) * rates["input"]
-        output_cost = (output_tokens / 1_000_000) * rates["output"]
-        return round(input_cost + output_cost, 6)
+    rates = _get_rates(provider.lower(), model.lower())
+    if rates is None:
+        return 0.0
 
-    return 0.0
+    input_cost = (input_tokens / 1_000_000) * rates[0]
+    output_cost = (output_tokens / 1_000_000) * rates[1]
+    return round(input_cost + output_cost, 6)
 
 
 class PromptLogger:
@@ -143,7 +252,32 @@ class PromptLogger:
         """
         self.repo_path = repo_path or Path.cwd()
         self.db_path = get_local_db_path(self.repo_path)
-        init_prompts_db(self.repo_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection for the logger's lifetime, in autocommit mode so each
+        # statement commits on its own and batches use explicit transactions.
+        # WAL + synchronous=NORMAL avoids a full fsync per logged prompt.
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        # 8 KiB pages for a new database (ignored for an existing one, and
+        # must come before switching to WAL); reads go through a 256 MiB mmap
+        self._conn.execute("PRAGMA page_size=8192")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        # Deleting a log also removes its prompt_previews row
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # Serializes use of the shared connection across threads
+        self._lock = threading.Lock()
+        _create_prompts_schema(self._conn)
+
+    def close(self):
+        """Close the logger's database connection."""
+        with self._lock:
+            self._conn.close()
 
     def log_prompt(
         self,
@@ -161,6 +295,7 @@ class PromptLogger:
         tool_name: Optional[str] = None,
         cost: Optional[float] = None,
         metadata: Optional[Dict] = None,
+        timestamp: Optional[str] = None,
     ) -> PromptLog:
         """
         Log a prompt interaction.
@@ -180,12 +315,93 @@ class PromptLogger:
             tool_name: Tool that made the request ('claude-code', etc.)
             cost: Override calculated cost (optional)
             metadata: Additional metadata dict
+            timestamp: ISO timestamp of the interaction (defaults to now)
 
         Returns:
             The created PromptLog entry
         """
-        timestamp = datetime.now().isoformat()
-        repo_path_str = str(self.repo_path.resolve())
+        entry = self._build_entry(
+            provider, model, input_tokens, output_tokens, duration,
+            prompt_preview, response_preview, status, error_message,
+            session_id, user, tool_name, cost, metadata, timestamp,
+        )
+        with self._lock:
+            if not (entry.prompt_preview or entry.response_preview):
+                # Single row, so the autocommit INSERT is already atomic
+                cursor = self._conn.execute(_INSERT_PROMPT_SQL, _prompt_log_row(entry))
+                entry.id = cursor.lastrowid
+                return entry
+
+            self._conn.execute("BEGIN")
+            try:
+                cursor = self._conn.execute(_INSERT_PROMPT_SQL, _prompt_log_row(entry))
+                entry.id = cursor.lastrowid
+                self._conn.execute(_INSERT_PREVIEW_SQL, _prompt_preview_row(entry))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return entry
+
+    def log_prompts_batch(self, entries: List[Dict[str, Any]]) -> List[PromptLog]:
+        """
+        Log several prompt interactions in a single transaction.
+
+        Args:
+            entries: One dict per prompt, with the same keyword arguments as log_prompt
+
+        Returns:
+            The created PromptLog entries, in the order given
+        """
+        return self._insert_logs([self._build_entry(**fields) for fields in entries])
+
+    def _insert_logs(self, logs: List[PromptLog]) -> List[PromptLog]:
+        """Insert built PromptLogs in one transaction, setting their ids."""
+        if not logs:
+            return []
+
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so the new ids are consecutive
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_INSERT_PROMPT_SQL, [_prompt_log_row(log) for log in logs])
+                last_id = self._conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                first_id = last_id - len(logs) + 1
+                for offset, log in enumerate(logs):
+                    log.id = first_id + offset
+                self._conn.executemany(
+                    _INSERT_PREVIEW_SQL,
+                    [
+                        _prompt_preview_row(log) for log in logs
+                        if log.prompt_preview or log.response_preview
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return logs
+
+    @staticmethod
+    def _build_entry(
+        provider: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        duration: float = 0.0,
+        prompt_preview: str = "",
+        response_preview: str = "",
+        status: str = "success",
+        error_message: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        cost: Optional[float] = None,
+        metadata: Optional[Dict] = None,
+        timestamp: Optional[str] = None,
+    ) -> PromptLog:
+        """Build an unsaved PromptLog (id 0) from log_prompt arguments."""
+        timestamp = timestamp or datetime.now().isoformat()
         total_tokens = input_tokens + output_tokens
 
         # Calculate cost if not provided
@@ -193,39 +409,14 @@ class PromptLogger:
             cost = calculate_cost(provider, model, input_tokens, output_tokens)
 
         # Truncate previews
-        if prompt_preview and len(prompt_preview) > 500:
-            prompt_preview = prompt_preview[:500] + "..."
-        if response_preview and len(response_preview) > 500:
-            response_preview = response_preview[:500] + "..."
+        prompt_preview = _truncate_preview(prompt_preview)
+        response_preview = _truncate_preview(response_preview)
 
         # Serialize metadata
-        metadata_str = json.dumps(metadata) if metadata else None
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO prompt_logs (
-                timestamp, provider, model,
-                input_tokens, output_tokens, total_tokens, cost, duration,
-                prompt_preview, response_preview, status, error_message,
-                session_id, user, tool_name, metadata
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                timestamp, provider, model,
-                input_tokens, output_tokens, total_tokens, cost, duration,
-                prompt_preview, response_preview, status, error_message,
-                session_id, user, tool_name, metadata_str
-            )
-        )
-        entry_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        metadata_str = _dump_json(metadata) if metadata else None
 
         return PromptLog(
-            id=entry_id,
+            id=0,
             timestamp=timestamp,
             provider=provider,
             model=model,
@@ -251,49 +442,80 @@ class PromptLogger:
         session_id: Optional[str] = None,
         provider: Optional[str] = None,
         status: Optional[str] = None,
+        cursor: Optional[Tuple[str, int]] = None,
+        include_previews: bool = True,
     ) -> List[Dict]:
         """
         Get prompt logs for this repository.
 
+        Pages are fetched by keyset: pass the (timestamp, id) of the last entry
+        of one page as ``cursor`` to get the next, at constant cost per page.
+
         Args:
             limit: Maximum number of entries to return
-            offset: Offset for pagination
+            offset: Deprecated, use cursor. Offset for pagination
             session_id: Filter by session ID
             provider: Filter by provider
             status: Filter by status
+            cursor: (timestamp, id) of the last entry of the previous page
+            include_previews: Load the prompt/response previews; pass False for a
+                cheaper listing that returns them as empty strings
 
         Returns:
             List of prompt log entries (most recent first)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        query = """
-            SELECT id, timestamp, provider, model,
-                   input_tokens, output_tokens, total_tokens, cost, duration,
-                   prompt_preview, response_preview, status, error_message,
-                   session_id, user, tool_name, metadata
-            FROM prompt_logs
+        self.drain_queue()
+
+        if include_previews:
+            # Older rows still carry their previews inline in prompt_logs
+            preview_columns = (
+                "COALESCE(p.prompt_preview, l.prompt_preview), "
+                "COALESCE(p.response_preview, l.response_preview)"
+            )
+            preview_join = "LEFT JOIN prompt_previews AS p ON p.prompt_id = l.id"
+        else:
+            preview_columns = "NULL, NULL"
+            preview_join = ""
+
+        query = f"""
+            SELECT l.id, l.timestamp, l.provider, l.model,
+                   l.input_tokens, l.output_tokens, l.total_tokens, l.cost, l.duration,
+                   {preview_columns}, l.status, l.error_message,
+                   l.session_id, l.user, l.tool_name, l.metadata
+            FROM prompt_logs AS l
+            {preview_join}
             WHERE 1=1
         """
         params = []
 
         if session_id:
-            query += " AND session_id = ?"
+            query += " AND l.session_id = ?"
             params.append(session_id)
         if provider:
-            query += " AND provider = ?"
+            query += " AND l.provider = ?"
             params.append(provider)
         if status:
-            query += " AND status = ?"
+            query += " AND l.status = ?"
             params.append(status)
 
-        query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        if cursor:
+            query += " AND (l.timestamp, l.id) < (?, ?)"
+            params.extend(cursor)
+
+        # id breaks timestamp ties so the cursor position is unambiguous
+        query += " ORDER BY l.timestamp DESC, l.id DESC LIMIT ?"
+        params.append(limit)
+        if offset:
+            warnings.warn(
+                "get_prompts(offset=...) is deprecated; page with cursor=(timestamp, id)",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            query += " OFFSET ?"
+            params.append(offset)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
 
         return [
             {
@@ -313,7 +535,7 @@ class PromptLogger:
                 "sessionId": row[13],
                 "user": row[14],
                 "toolName": row[15],
-                "metadata": json.loads(row[16]) if row[16] else None
+                "metadata": _load_json(row[16]) if row[16] else None
             }
             for row in rows
         ]
@@ -325,77 +547,248 @@ class PromptLogger:
         Returns:
             Dict with total prompts, tokens, cost, etc.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                COUNT(*) as total_prompts,
-                COALESCE(SUM(input_tokens), 0) as total_input_tokens,
-                COALESCE(SUM(output_tokens), 0) as total_output_tokens,
-                COALESCE(SUM(total_tokens), 0) as total_tokens,
-                COALESCE(SUM(cost), 0) as total_cost,
-                COALESCE(AVG(duration), 0) as avg_duration,
-                COUNT(DISTINCT provider) as providers_used,
-                COUNT(DISTINCT model) as models_used,
-                COUNT(CASE WHEN status = 'error' THEN 1 END) as error_count
-            FROM prompt_logs
-            """
-        )
-        row = cursor.fetchone()
-
-        # Get breakdown by provider
-        cursor.execute(
-            """
-            SELECT provider, COUNT(*), SUM(cost), SUM(total_tokens)
-            FROM prompt_logs
-            GROUP BY provider
-            """
-        )
-        provider_rows = cursor.fetchall()
-
-        conn.close()
+        self.drain_queue()
+
+        # One pass grouped by (provider, model); totals, distinct counts and the
+        # per-provider breakdown are all folded from these few group rows
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT
+                    provider,
+                    model,
+                    COUNT(*),
+                    COALESCE(SUM(input_tokens), 0),
+                    COALESCE(SUM(output_tokens), 0),
+                    COALESCE(SUM(total_tokens), 0),
+                    COALESCE(SUM(cost), 0),
+                    COALESCE(SUM(duration), 0),
+                    COUNT(duration),
+                    COUNT(CASE WHEN status = 'error' THEN 1 END)
+                FROM prompt_logs
+                GROUP BY provider, model
+                """
+            ).fetchall()
+
+        total_prompts = total_input = total_output = total_tokens = error_count = 0
+        total_cost = total_duration = duration_count = 0
+        by_provider: Dict[str, Dict[str, Any]] = {}
+        models = set()
+        for (
+            provider, model, count, input_tokens, output_tokens, tokens, cost,
+            duration, durations, errors,
+        ) in rows:
+            total_prompts += count
+            total_input += input_tokens
+            total_output += output_tokens
+            total_tokens += tokens
+            total_cost += cost
+            total_duration += duration
+            duration_count += durations
+            error_count += errors
+            models.add(model)
+
+            provider_stats = by_provider.setdefault(provider, {"count": 0, "cost": 0, "tokens": 0})
+            provider_stats["count"] += count
+            provider_stats["cost"] += cost
+            provider_stats["tokens"] += tokens
+
+        for provider_stats in by_provider.values():
+            provider_stats["cost"] = round(provider_stats["cost"], 4)
 
         return {
-            "totalPrompts": row[0],
-            "totalInputTokens": row[1],
-            "totalOutputTokens": row[2],
-            "totalTokens": row[3],
-            "totalCost": round(row[4], 4),
-            "avgDuration": round(row[5], 2),
-            "providersUsed": row[6],
-            "modelsUsed": row[7],
-            "errorCount": row[8],
-            "byProvider": {
-                p_row[0]: {
-                    "count": p_row[1],
-                    "cost": round(p_row[2] or 0, 4),
-                    "tokens": p_row[3] or 0
-                }
-                for p_row in provider_rows
-            }
+            "totalPrompts": total_prompts,
+            "totalInputTokens": total_input,
+            "totalOutputTokens": total_output,
+            "totalTokens": total_tokens,
+            "totalCost": round(total_cost, 4),
+            # Same as AVG(duration): rows without a duration are left out
+            "avgDuration": round(total_duration / duration_count, 2) if duration_count else 0,
+            "providersUsed": len(by_provider),
+            "modelsUsed": len(models),
+            "errorCount": error_count,
+            "byProvider": by_provider,
         }
 
     def delete_prompt(self, prompt_id: int) -> bool:
         """Delete a prompt log entry."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM prompt_logs WHERE id = ?", (prompt_id,))
-        deleted = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
-        return deleted
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM prompt_logs WHERE id = ?", (prompt_id,))
+        return cursor.rowcount > 0
 
     def clear_all(self) -> int:
         """Clear all prompt logs for this repository."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM prompt_logs")
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-        return deleted
+        self.drain_queue()
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM prompt_logs")
+        return cursor.rowcount
+
+    def drain_queue(self) -> int:
+        """
+        Log the prompts hooks have queued for this repository.
+
+        The queue file is claimed by renaming it to a name unique to this
+        call, so prompts queued while draining go to a fresh queue and
+        concurrent drains never read the same prompts. Claims left behind
+        by drains that died are drained too. Each claim is inserted in one
+        transaction; if that fails its prompts are queued again.
+
+        Returns:
+            Number of prompts logged
+        """
+        queue_path = get_prompt_queue_path(self.repo_path)
+        count = 0
+        for source in [*_abandoned_claims(queue_path), queue_path]:
+            claim_path = _claim_queue(source, queue_path)
+            if claim_path is None:
+                continue  # Nothing queued, or another drain took it first
+            try:
+                count += self._drain_claim(claim_path, queue_path)
+            finally:
+                _release_claim(claim_path)
+        return count
+
+    def _drain_claim(self, claim_path: Path, queue_path: Path) -> int:
+        """Log the prompts in a claimed queue file, re-queueing them if that fails."""
+        data = _read_claim(claim_path)
+        logs = []
+        for line in data.splitlines():
+            # Skip lines cut short by a crash or that aren't log_prompt arguments,
+            # so one bad line can't block the queue
+            try:
+                logs.append(self._build_entry(**_load_json(line)))
+            except (TypeError, ValueError):
+                continue
+        try:
+            self._insert_logs(logs)
+        except Exception:
+            _append_to_queue(queue_path, data)
+            raise
+        return len(logs)
+
+
+def _claim_queue(source: Path, queue_path: Path) -> Optional[Path]:
+    """
+    Claim a queue file for one drain by renaming it to a unique claim name.
+
+    Args:
+        source: The queue, or an abandoned claim of it
+        queue_path: The queue the claim belongs to
+
+    Returns:
+        The claimed file, or None if source no longer exists
+    """
+    name = f"{queue_path.name}.{os.getpid()}.{time.time_ns()}.{uuid.uuid4().hex}.draining"
+    # Registered before the rename so no scan sees it unregistered
+    with _active_claims_lock:
+        _active_claims.add(name)
+    claim_path = queue_path.with_name(name)
+    try:
+        os.replace(source, claim_path)
+    except FileNotFoundError:
+        with _active_claims_lock:
+            _active_claims.discard(name)
+        return None
+    return claim_path
+
+
+def _read_claim(claim_path: Path) -> bytes:
+    """Read a claimed queue file once appends that opened it before the claim are done."""
+    with open(claim_path, "rb") as f:
+        if fcntl is not None:
+            # Appenders hold a shared lock while writing (see _append_to_queue)
+            fcntl.flock(f, fcntl.LOCK_EX)
+        return f.read()
+
+
+def _release_claim(claim_path: Path) -> None:
+    """Delete a drained claim file."""
+    try:
+        claim_path.unlink()
+    except FileNotFoundError:
+        pass
+    with _active_claims_lock:
+        _active_claims.discard(claim_path.name)
+
+
+def _abandoned_claims(queue_path: Path) -> Iterator[Path]:
+    """Yield claims of a queue whose drains died before deleting them."""
+    prefix = f"{queue_path.name}."
+    pid = os.getpid()
+    now = time.time_ns()
+    for path in queue_path.parent.glob(f"{prefix}*.draining"):
+        with _active_claims_lock:
+            if path.name in _active_claims:
+                continue  # Being drained by this process
+        parts = path.name[len(prefix):-len(".draining")].split(".")
+        try:
+            claim_pid, claimed_at = int(parts[0]), int(parts[1])
+        except (IndexError, ValueError):
+            # Named without a claim time (older versions): go by modification time
+            claim_pid = None
+            try:
+                claimed_at = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        # This process's claims are all registered, so an unregistered one
+        # with its pid is left over from an earlier process
+        if claim_pid == pid or now - claimed_at > _ABANDONED_CLAIM_SECONDS * 1_000_000_000:
+            yield path
+
+
+def _dump_json(value: Any) -> str:
+    """Serialize a value to a JSON string, with orjson when installed."""
+    if orjson is not None:
+        # Non-str keys are stringified, as json.dumps does
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+_load_json = orjson.loads if orjson is not None else json.loads
+
+
+def _append_to_queue(queue_path: Path, data: bytes) -> None:
+    """Append whole lines to a prompt queue with a single O_APPEND write."""
+    queue_path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        fd = os.open(queue_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                # A drain may have claimed the file since it was opened; it
+                # reads under an exclusive lock, so once this shared lock is
+                # held the file is either still the queue or must be reopened
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                try:
+                    if os.stat(queue_path).st_ino != os.fstat(fd).st_ino:
+                        continue
+                except FileNotFoundError:
+                    continue
+            os.write(fd, data)
+            return
+        finally:
+            os.close(fd)
+
+
+def _truncate_preview(text: str) -> str:
+    """Cut a preview to _PREVIEW_CHARS characters, marking the cut with '...'."""
+    if text and len(text) > _PREVIEW_CHARS:
+        return text[:_PREVIEW_CHARS] + "..."
+    return text
+
+
+def _prompt_log_row(entry: PromptLog) -> tuple:
+    """Parameters for _INSERT_PROMPT_SQL from a PromptLog."""
+    return (
+        entry.timestamp, entry.provider, entry.model,
+        entry.input_tokens, entry.output_tokens, entry.total_tokens, entry.cost, entry.duration,
+        entry.status, entry.error_message, entry.session_id, entry.user, entry.tool_name,
+        entry.metadata
+    )
+
+
+def _prompt_preview_row(entry: PromptLog) -> tuple:
+    """Parameters for _INSERT_PREVIEW_SQL from a logged PromptLog."""
+    return (entry.id, entry.prompt_preview, entry.response_preview)
 
 
 # Convenience function for use from hooks
@@ -447,3 +840,41 @@ def log_claude_code_prompt(
         tool_name="claude-code",
     )
     return asdict(entry)
+
+
+def queue_claude_code_prompt(
+    cwd: str,
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    duration_ms: int,
+    session_id: str,
+    user: Optional[str] = None,
+    prompt_preview: str = "",
+    response_preview: str = "",
+    status: str = "success",
+    error_message: Optional[str] = None,
+) -> None:
+    """
+    Queue a Claude Code prompt to be logged later, without opening the database.
+
+    Takes the same arguments as log_claude_code_prompt. The prompt is
+    appended to the repo's prompt queue, which PromptLogger drains before
+    reading logs (or `monkey drain` does explicitly).
+    """
+    entry = {
+        "provider": "anthropic",
+        "model": model,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "duration": duration_ms / 1000.0,
+        "prompt_preview": _truncate_preview(prompt_preview),
+        "response_preview": _truncate_preview(response_preview),
+        "status": status,
+        "error_message": error_message,
+        "session_id": session_id,
+        "user": user or os.environ.get("USER", "unknown"),
+        "tool_name": "claude-code",
+        "timestamp": datetime.now().isoformat(),
+    }
+    _append_to_queue(get_prompt_queue_path(Path(cwd)), (_dump_json(entry) + "\n").encode())
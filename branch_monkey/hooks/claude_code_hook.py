@@ -24,23 +24,169 @@ Stdin receives JSON with:
 
 import sys
 import json
+import mmap
 import os
+from dataclasses import dataclass, asdict
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Optional faster JSON parsing; falls back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from branch_monkey.core.prompts import log_claude_code_prompt
+# Add the repository root to the path for imports when run as a script
+if not __package__:
+    _ROOT = str(Path(__file__).resolve().parents[2])
+    if _ROOT not in sys.path:
+        sys.path.insert(0, _ROOT)
 
+# Both accept bytes and raise a json.JSONDecodeError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-def read_transcript(transcript_path: str) -> tuple[str, str, str, int, int, float]:
+
+def _json_dumps(value) -> bytes:
+    """Encode value as JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+# Largest hook payload read from stdin; hook payloads are small JSON objects
+_MAX_STDIN_BYTES = 8 * 1024 * 1024
+
+# Trailing bytes of a transcript scanned for the last exchange; the scan
+# normally stops well before this, it bounds transcripts where it doesn't
+_MAX_SCAN_BYTES = 4 * 1024 * 1024
+
+# Transcripts whose read_transcript results are kept in the sidecar cache
+_TRANSCRIPT_CACHE_ENTRIES = 20
+
+# Process environment, resolved once at import. This is only valid because the
+# hook runs as a fresh process per event and exits after a single main() call.
+_USER = os.environ.get('USER', 'unknown')
+_DEBUG = bool(os.environ.get('BRANCH_MONKEY_DEBUG'))
+try:
+    _DEFAULT_CWD = os.getcwd()
+except OSError:
+    _DEFAULT_CWD = '.'  # The working directory was removed
+
+
+def _stderr_discarded() -> bool:
+    """Check whether stderr is redirected to the null device."""
+    try:
+        st, null = os.fstat(sys.stderr.fileno()), os.stat(os.devnull)
+    except (AttributeError, OSError, ValueError):
+        return False
+    return (st.st_dev, st.st_ino) == (null.st_dev, null.st_ino)
+
+
+# Claude Code reads stderr through a pipe (not a tty), so only a stderr
+# sent to the null device is treated as unread
+_STDERR_DISCARDED = _stderr_discarded()
+
+
+def _iter_lines_reverse(
+    path: str, size: Optional[int] = None, needles: tuple = (), max_bytes: Optional[int] = None
+):
+    """Yield the lines of a file as bytes, last line first.
+
+    The file is memory-mapped and scanned backwards from the end, so only
+    the pages holding the lines visited are read. With needles, lines that
+    contain none of them are skipped without being copied. With size, only
+    the first size bytes are read (the file as last stat()ed). With max_bytes,
+    the scan stops at lines ending before the trailing max_bytes of the file.
+    """
+    with open(path, 'rb') as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            end = size
+            floor = max(0, size - max_bytes) if max_bytes else 0
+            while end >= floor:
+                start = mm.rfind(b'\n', 0, end) + 1
+                if not needles or any(mm.find(needle, start, end) >= 0 for needle in needles):
+                    yield mm[start:end]
+                end = start - 1
+
+
+def read_transcript(
+    transcript_path: str,
+    cache_path: Optional[Path] = None,
+    st: Optional[os.stat_result] = None,
+) -> tuple[str, str, str, int, int, float]:
     """Read the transcript file to extract conversation data.
 
+    With cache_path, results are remembered per transcript by size and
+    modification time, so a hook firing again on an unchanged transcript
+    doesn't re-read it.
+
+    Args:
+        transcript_path: Path to the conversation JSONL file
+        cache_path: Sidecar cache file for results (optional)
+        st: The transcript's os.stat() result, if the caller already has it
+
     Returns:
         tuple of (prompt_preview, response_preview, model, input_tokens, output_tokens, duration_ms)
     """
-    from datetime import datetime
+    if st is None:
+        try:
+            st = os.stat(transcript_path)
+        except OSError:
+            return _scan_transcript(transcript_path)
+
+    if cache_path is None:
+        return _scan_transcript(transcript_path, st.st_size)
+
+    cache = _load_transcript_cache(cache_path)
+    cached = cache.get(transcript_path)
+    if cached and cached['size'] == st.st_size and cached['mtime_ns'] == st.st_mtime_ns:
+        return tuple(cached['result'])
+
+    result = _scan_transcript(transcript_path, st.st_size)
+    # Re-insert so the most recently read transcripts are last
+    cache.pop(transcript_path, None)
+    cache[transcript_path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'result': result}
+    _save_transcript_cache(cache_path, dict(list(cache.items())[-_TRANSCRIPT_CACHE_ENTRIES:]))
+    return result
+
+
+def _load_transcript_cache(cache_path: Path) -> dict:
+    """Load the transcript cache, or an empty one if it is missing or unreadable."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = _json_loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_transcript_cache(cache_path: Path, cache: dict) -> None:
+    """Write the transcript cache atomically, ignoring failures."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 
+def _scan_transcript(
+    transcript_path: str, size: Optional[int] = None
+) -> tuple[str, str, str, int, int, float]:
+    """Extract conversation data by scanning the transcript (its first size bytes) from its end.
+
+    Returns:
+        tuple of (prompt_preview, response_preview, model, input_tokens, output_tokens, duration_ms)
+    """
     prompt_preview = ''
     response_preview = ''
     model = 'unknown'
@@ -48,79 +194,60 @@ def read_transcript(transcript_path: str) -> tuple[str, str, str, int, int, floa
     output_tokens = 0
     duration_ms = 0.0
 
-    # Track timestamps for duration calculation
-    last_user_timestamp = None
-    last_assistant_timestamp = None
+    # Timestamps for the duration calculation
+    last_user_time = None
+    last_assistant_time = None
 
     try:
-        with open(transcript_path, 'r') as f:
-            # JSONL file - each line is a JSON object
-            lines = f.readlines()
-
-            # Find the last user and assistant messages
-            for line in reversed(lines):
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    msg_type = entry.get('type', '')
-                    message = entry.get('message', {})
-                    timestamp_str = entry.get('timestamp', '')
-
-                    # Extract from assistant messages
-                    if msg_type == 'assistant':
-                        # Model is inside message object
-                        if model == 'unknown' and 'model' in message:
-                            model = message['model']
-
-                        # Token usage is inside message.usage
-                        usage = message.get('usage', {})
-                        if usage:
-                            input_tokens = max(input_tokens, usage.get('input_tokens', 0))
-                            output_tokens = max(output_tokens, usage.get('output_tokens', 0))
-
-                        # Response content
-                        if not response_preview:
-                            content = message.get('content', '')
-                            if isinstance(content, str):
-                                response_preview = content[:500]
-                            elif isinstance(content, list):
-                                texts = [b.get('text', '') for b in content if isinstance(b, dict) and 'text' in b]
-                                response_preview = ' '.join(texts)[:500]
-
-                        # Track last assistant timestamp
-                        if not last_assistant_timestamp and timestamp_str:
-                            try:
-                                last_assistant_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                            except:
-                                pass
-
-                    # Extract from user messages
-                    elif msg_type == 'user':
-                        if not prompt_preview:
-                            content = message.get('content', '')
-                            if isinstance(content, str):
-                                prompt_preview = content[:500]
-                            elif isinstance(content, list):
-                                texts = [b.get('text', '') for b in content if isinstance(b, dict) and 'text' in b]
-                                prompt_preview = ' '.join(texts)[:500]
-
-                            # Track user timestamp (only for the message we're extracting)
-                            if timestamp_str:
-                                try:
-                                    last_user_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                except:
-                                    pass
-
-                    if prompt_preview and response_preview and model != 'unknown':
-                        break
-
-                except json.JSONDecodeError:
-                    continue
+        # JSONL file - each line is a JSON object. Read from the end, since
+        # only the last user and assistant messages are needed; other entries
+        # (attachments, system entries, blank lines) are skipped undecoded.
+        needles = (b'"user"', b'"assistant"')
+        for line in _iter_lines_reverse(transcript_path, size, needles, _MAX_SCAN_BYTES):
+            try:
+                entry = _json_loads(line)
+                msg_type = entry.get('type', '')
+                message = entry.get('message', {})
+                timestamp_str = entry.get('timestamp', '')
+
+                # Extract from assistant messages
+                if msg_type == 'assistant':
+                    # Model is inside message object
+                    if model == 'unknown' and 'model' in message:
+                        model = message['model']
+
+                    # Token usage is inside message.usage
+                    usage = message.get('usage', {})
+                    if usage:
+                        input_tokens = max(input_tokens, usage.get('input_tokens', 0))
+                        output_tokens = max(output_tokens, usage.get('output_tokens', 0))
+
+                    # Response content
+                    if not response_preview:
+                        response_preview = _preview(message.get('content', ''))
+
+                    # Track last assistant timestamp, skipping ones that don't parse
+                    if last_assistant_time is None:
+                        last_assistant_time = _parse_timestamp(timestamp_str)
+
+                # Extract from user messages
+                elif msg_type == 'user':
+                    if not prompt_preview:
+                        prompt_preview = _preview(message.get('content', ''))
+
+                        # Track user timestamp (only for the message we're extracting)
+                        last_user_time = _parse_timestamp(timestamp_str)
+
+                if prompt_preview and response_preview and model != 'unknown':
+                    break
+
+            except ValueError:
+                # Malformed JSON or invalid UTF-8
+                continue
 
         # Calculate duration if we have both timestamps
-        if last_user_timestamp and last_assistant_timestamp:
-            delta = last_assistant_timestamp - last_user_timestamp
+        if last_user_time and last_assistant_time:
+            delta = last_assistant_time - last_user_time
             duration_ms = max(0, delta.total_seconds() * 1000)
 
     except Exception:
@@ -129,93 +256,174 @@ def read_transcript(transcript_path: str) -> tuple[str, str, str, int, int, floa
     return prompt_preview, response_preview, model, input_tokens, output_tokens, duration_ms
 
 
+@dataclass
+class LogArgs:
+    """Arguments for queue_claude_code_prompt extracted from a hook payload."""
+    cwd: str
+    session_id: str = ''
+    user: str = 'unknown'
+    model: str = 'unknown'
+    input_tokens: int = 0
+    output_tokens: int = 0
+    duration_ms: float = 0.0
+    prompt_preview: str = ''
+    response_preview: str = ''
+
+
+def _from_transcript(data: dict, cwd: str) -> LogArgs:
+    """Build the log arguments for a hook payload from its conversation transcript.
+
+    Args:
+        data: Decoded hook payload
+        cwd: The session's working directory (the payload's cwd, already resolved)
+    """
+    args = LogArgs(
+        cwd=cwd,
+        session_id=data.get('session_id', ''),
+        user=_USER,
+    )
+
+    transcript_path = data.get('transcript_path', '')
+    try:
+        # The one stat() of the transcript, reused for the cache check and the read
+        st = os.stat(transcript_path) if transcript_path else None
+    except OSError:
+        st = None
+    if st is not None:
+        (
+            args.prompt_preview, args.response_preview, args.model,
+            args.input_tokens, args.output_tokens, args.duration_ms,
+        ) = read_transcript(
+            transcript_path, Path(cwd) / ".branch_monkey" / "transcript_cache.json", st
+        )
+    return args
+
+
+def _read_stdin() -> bytes:
+    """Read the raw hook payload from stdin, up to _MAX_STDIN_BYTES.
+
+    Reads the file descriptor directly, skipping the text IO layer; the JSON
+    parser decodes UTF-8 itself.
+    """
+    chunks = []
+    size = 0
+    while size <= _MAX_STDIN_BYTES:
+        chunk = os.read(0, 65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks)
+
+
+def _preview(content, limit: int = 500) -> str:
+    """Preview of a message's content: a string, or a list of blocks with joined texts.
+
+    Stops collecting blocks once the joined text reaches limit, so long
+    outputs aren't copied only to be cut off.
+    """
+    if isinstance(content, str):
+        return content[:limit]
+    if isinstance(content, list):
+        texts = []
+        length = -1  # no separator before the first text
+        for block in content:
+            if isinstance(block, dict) and 'text' in block:
+                texts.append(block['text'])
+                length += len(block['text']) + 1
+                if length >= limit:
+                    break
+        return ' '.join(texts)[:limit]
+    return ''
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 transcript timestamp ('Z' suffix allowed), or None if invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _write_json(stream, payload: dict) -> None:
+    """Write payload as one JSON line straight to a binary stream (stdout.buffer, ...)."""
+    stream.write(_json_dumps(payload) + b'\n')
+    stream.flush()
+
+
+def _open_debug_log(path: Path):
+    """Open the debug log for appending (line-buffered) if BRANCH_MONKEY_DEBUG is set."""
+    if not _DEBUG:
+        return None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, 'a', buffering=1)
+    except OSError:
+        return None  # Silently ignore debug log failures
+
+
 def main():
     """Main entry point for the hook."""
-    # Debug log will be set after we know the cwd
+    # Debug log file, opened once we know the cwd (only with BRANCH_MONKEY_DEBUG set)
     debug_log = None
 
     def log_debug(msg):
-        if debug_log is None:
-            return  # Skip logging if we don't have a path yet
-        try:
-            debug_log.parent.mkdir(parents=True, exist_ok=True)
-            with open(debug_log, 'a') as f:
-                from datetime import datetime
-                f.write(f"{datetime.now()}: {msg}\n")
-        except Exception:
-            pass  # Silently ignore debug log failures
+        if debug_log is not None:
+            debug_log.write(f"{datetime.now()}: {msg}\n")
 
     try:
         # Read hook data from stdin
         if sys.stdin.isatty():
             return
 
-        input_data = sys.stdin.read()
+        input_data = _read_stdin()
 
-        if not input_data.strip():
+        if not input_data or input_data.isspace():
             return
 
-        data = json.loads(input_data)
+        data = _json_loads(input_data)
 
         # Set debug log path based on cwd
-        cwd = data.get('cwd', os.getcwd())
-        debug_log = Path(cwd) / ".branch_monkey" / "hook_debug.log"
+        cwd = data.get('cwd', _DEFAULT_CWD)
+        debug_log = _open_debug_log(Path(cwd) / ".branch_monkey" / "hook_debug.log")
 
         log_debug("Hook started")
         log_debug(f"Parsed JSON: cwd={cwd}, session={data.get('session_id')}")
 
-        # Extract fields from stdin JSON
-        cwd = data.get('cwd', os.getcwd())
-        session_id = data.get('session_id', '')
-        transcript_path = data.get('transcript_path', '')
-
-        # Read transcript file for conversation data
-        prompt_preview = ''
-        response_preview = ''
-        model = 'unknown'
-        input_tokens = 0
-        output_tokens = 0
-        duration_ms = 0.0
-
-        if transcript_path and Path(transcript_path).exists():
-            prompt_preview, response_preview, model, input_tokens, output_tokens, duration_ms = read_transcript(transcript_path)
-
-        # User
-        user = os.environ.get('USER', 'unknown')
-
-        # Log the prompt
-        result = log_claude_code_prompt(
-            cwd=cwd,
-            model=model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            duration_ms=duration_ms,
-            session_id=session_id,
-            user=user,
-            prompt_preview=prompt_preview,
-            response_preview=response_preview,
-            status='success',
-            error_message=None
-        )
+        args = _from_transcript(data, cwd)
 
-        log_debug(f"Logged prompt id={result.get('id')}, model={model}, tokens={input_tokens}+{output_tokens}")
+        # Imported only once there is something to log
+        from branch_monkey.core.prompts import queue_claude_code_prompt
+
+        # Queue the prompt; it's written to the database when logs are next read
+        queue_claude_code_prompt(**asdict(args))
+
+        model, input_tokens, output_tokens = args.model, args.input_tokens, args.output_tokens
+        log_debug(f"Queued prompt, model={model}, tokens={input_tokens}+{output_tokens}")
 
         # Output result as JSON (stdout for success)
-        print(json.dumps({'success': True, 'id': result.get('id')}))
+        _write_json(sys.stdout.buffer, {'success': True, 'queued': True})
 
-        # User-friendly message to stderr (visible in Claude Code)
-        total_tokens = input_tokens + output_tokens
-        if total_tokens > 0:
-            print(f"[Branch Monkey] Logged: {model} | {input_tokens:,}+{output_tokens:,} tokens", file=sys.stderr)
+        # User-friendly message to stderr (visible in Claude Code), unless it's discarded
+        if _STDERR_DISCARDED:
+            return
+        if input_tokens or output_tokens:
+            status = f"[Branch Monkey] Logged: {model} | {input_tokens:,}+{output_tokens:,} tokens\n"
         else:
-            print(f"[Branch Monkey] Logged prompt (no token data)", file=sys.stderr)
+            status = "[Branch Monkey] Logged prompt (no token data)\n"
+        sys.stderr.write(status)
 
     except Exception as e:
         log_debug(f"Error: {str(e)}")
         # Error message to stderr
         print(f"[Branch Monkey] Failed to log prompt: {str(e)}", file=sys.stderr)
-        print(json.dumps({'success': False, 'error': str(e)}), file=sys.stderr)
+        _write_json(sys.stderr.buffer, {'success': False, 'error': str(e)})
         sys.exit(1)
+    finally:
+        if debug_log is not None:
+            debug_log.close()
 
 
 if __name__ == '__main__':
@@ -19,12 +19,13 @@ Usage:
         }
 """
 
-import json
-import subprocess
 import sys
 import os
+import socket
+import threading
+import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 # MCP SDK imports
 try:
@@ -35,302 +36,484 @@ except ImportError:
     print("MCP SDK not installed. Install with: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
-from .api import BranchMonkey
-from .core.context import CONTEXT_TYPES
+# The API (and GitPython behind it) is imported on the first tool call, so
+# the server can start and answer list_tools without loading it
+if TYPE_CHECKING:
+    from .api import BranchMonkey
 
 # Create the MCP server
 server = Server("branch-monkey")
 
+# BranchMonkey instances reused across tool calls, per repo path, with the
+# time each was last used; ones idle longer than this are rebuilt
+_MONKEY_IDLE_SECONDS = 60
+_monkeys: Dict[Path, Tuple["BranchMonkey", float]] = {}
+
+# Web API server started by monkey_ui (runs in this process until it exits)
+_ui_thread: Optional[threading.Thread] = None
+_ui_port: Optional[int] = None
+
 
 def get_repo_path() -> Path:
     """Get the current repository path from environment or cwd."""
     return Path(os.environ.get("MONKEY_REPO_PATH", os.getcwd()))
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available Branch Monkey tools."""
-    return [
-        Tool(
-            name="monkey_ui",
-            description="Start the Branch Monkey web UI for visual git management. Opens a browser with the commit tree visualization.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "port": {
-                        "type": "integer",
-                        "description": "Port to run the server on (default: 8081)",
-                        "default": 8081
-                    }
+# Tool definitions, built once: the schemas are static, so list_tools
+# returns the same objects for every request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="monkey_ui",
+        description="Start the Branch Monkey web UI for visual git management. Opens a browser with the commit tree visualization.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "port": {
+                    "type": "integer",
+                    "description": "Port to run the server on (default: 8081)",
+                    "default": 8081
                 }
             }
-        ),
-        Tool(
-            name="monkey_status",
-            description="Get the current status of the repository including unsaved changes, current branch/experiment, and recent checkpoints.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="monkey_save",
-            description="Save current work as a checkpoint (like a save point in a video game). This stages and commits all changes.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Description of what you're saving"
-                    }
-                },
-                "required": ["message"]
-            }
-        ),
-        Tool(
-            name="monkey_undo",
-            description="Go back to the previous checkpoint. Use with caution.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keep_changes": {
-                        "type": "boolean",
-                        "description": "Whether to keep current changes (default: true)",
-                        "default": True
-                    }
+        }
+    ),
+    Tool(
+        name="monkey_status",
+        description="Get the current status of the repository including unsaved changes, current branch/experiment, and recent checkpoints.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="monkey_save",
+        description="Save current work as a checkpoint (like a save point in a video game). This stages and commits all changes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "Description of what you're saving"
+                }
+            },
+            "required": ["message"]
+        }
+    ),
+    Tool(
+        name="monkey_undo",
+        description="Go back to the previous checkpoint. Use with caution.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keep_changes": {
+                    "type": "boolean",
+                    "description": "Whether to keep current changes (default: true)",
+                    "default": True
                 }
             }
-        ),
-        Tool(
-            name="monkey_experiment_start",
-            description="Start a new experiment branch for trying something new without affecting main work.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the experiment (e.g., 'refactor', 'new-feature')"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "What you're trying (optional)"
-                    }
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="monkey_experiment_keep",
-            description="Keep the current experiment by merging it into the base branch.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="monkey_experiment_discard",
-            description="Discard the current experiment and return to the base branch.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="monkey_context_prompt",
-            description="Get an AI prompt for generating a context summary. Copy this prompt, run it, then save the result with monkey_context_save.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "context_type": {
-                        "type": "string",
-                        "enum": ["codebase", "architecture", "prompts"],
-                        "description": "Type of context to generate: 'codebase' (file structure), 'architecture' (system design), or 'prompts' (AI prompts inventory)"
-                    }
+        }
+    ),
+    Tool(
+        name="monkey_experiment_start",
+        description="Start a new experiment branch for trying something new without affecting main work.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name for the experiment (e.g., 'refactor', 'new-feature')"
                 },
-                "required": ["context_type"]
-            }
-        ),
-        Tool(
-            name="monkey_context_save",
-            description="Save an AI-generated context summary to the history.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "context_type": {
-                        "type": "string",
-                        "enum": ["codebase", "architecture", "prompts"],
-                        "description": "Type of context being saved"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "The AI-generated summary content to save"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "What you're trying (optional)"
+                }
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="monkey_experiment_keep",
+        description="Keep the current experiment by merging it into the base branch.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="monkey_experiment_discard",
+        description="Discard the current experiment and return to the base branch.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="monkey_context_prompt",
+        description="Get an AI prompt for generating a context summary. Copy this prompt, run it, then save the result with monkey_context_save.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "context_type": {
+                    "type": "string",
+                    "enum": ["codebase", "architecture", "prompts"],
+                    "description": "Type of context to generate: 'codebase' (file structure), 'architecture' (system design), or 'prompts' (AI prompts inventory)"
+                }
+            },
+            "required": ["context_type"]
+        }
+    ),
+    Tool(
+        name="monkey_context_save",
+        description="Save an AI-generated context summary to the history.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "context_type": {
+                    "type": "string",
+                    "enum": ["codebase", "architecture", "prompts"],
+                    "description": "Type of context being saved"
                 },
-                "required": ["context_type", "content"]
+                "content": {
+                    "type": "string",
+                    "description": "The AI-generated summary content to save"
+                }
+            },
+            "required": ["context_type", "content"]
+        }
+    ),
+    Tool(
+        name="monkey_context_latest",
+        description="Get the most recent context summary for a given type.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "context_type": {
+                    "type": "string",
+                    "enum": ["codebase", "architecture", "prompts"],
+                    "description": "Type of context to retrieve"
+                }
+            },
+            "required": ["context_type"]
+        }
+    ),
+    Tool(
+        name="monkey_history",
+        description="Show recent commit history.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of commits to show (default: 10)",
+                    "default": 10
+                }
             }
-        ),
-        Tool(
-            name="monkey_context_latest",
-            description="Get the most recent context summary for a given type.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "context_type": {
-                        "type": "string",
-                        "enum": ["codebase", "architecture", "prompts"],
-                        "description": "Type of context to retrieve"
+        }
+    ),
+    Tool(
+        name="monkey_batch",
+        description="Run several Branch Monkey tools in one request, in order. Returns each tool's output.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run, in order",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name (e.g., 'monkey_status')"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
                     }
                 },
-                "required": ["context_type"]
-            }
-        ),
-        Tool(
-            name="monkey_history",
-            description="Show recent commit history.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of commits to show (default: 10)",
-                        "default": 10
-                    }
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip the remaining calls after one fails (default: false)",
+                    "default": False
                 }
-            }
-        ),
-    ]
+            },
+            "required": ["calls"]
+        }
+    ),
+]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
-    try:
-        repo_path = get_repo_path()
-        monkey = BranchMonkey(repo_path)
-
-        if name == "monkey_ui":
-            api_port = arguments.get("port", 8081)
-            frontend_port = 5176
-            # Start the API server in the background
-            subprocess.Popen(
-                [sys.executable, "-c",
-                 f"from branch_monkey.fastapi_server import run_server; run_server(port={api_port})"],
-                cwd=str(repo_path),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+def _get_monkey(repo_path: Path) -> "BranchMonkey":
+    """
+    Get the BranchMonkey for a repository, reusing a recently used one.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        BranchMonkey instance for repo_path
+    """
+    from .api import BranchMonkey
+
+    now = time.monotonic()
+    # Drop idle instances so long-lived git handles don't go stale
+    for path, (_, last_used) in list(_monkeys.items()):
+        if now - last_used > _MONKEY_IDLE_SECONDS:
+            del _monkeys[path]
+
+    cached = _monkeys.get(repo_path)
+    monkey = cached[0] if cached else BranchMonkey(repo_path)
+    _monkeys[repo_path] = (monkey, now)
+    return monkey
+
+
+def _port_in_use(port: int) -> bool:
+    """Check whether something is already listening on a local port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+def _start_ui_server(repo_path: Path, port: int) -> bool:
+    """
+    Start the web API server on a background thread of this process.
+
+    The server is started at most once and then reused by later monkey_ui
+    calls. A port that is already taken (e.g. by a server started from the
+    CLI) is left alone.
+
+    Args:
+        repo_path: Repository the server works on
+        port: Port to run the server on
+
+    Returns:
+        False if a server is already running (here or on the port), True if it was started
+    """
+    global _ui_thread, _ui_port
+    if _ui_thread is not None and _ui_thread.is_alive():
+        return False
+    if _port_in_use(port):
+        _ui_thread, _ui_port = None, port
+        return False
+
+    # fastapi_server.py sits next to the package in the source checkout
+    root = str(Path(__file__).resolve().parents[1])
+    if root not in sys.path:
+        sys.path.append(root)
+    from fastapi_server import run_server
+
+    # quiet: stdout carries the MCP protocol, so the server must not print to it
+    _ui_thread = threading.Thread(
+        target=run_server,
+        kwargs={"repo_path": repo_path, "port": port, "quiet": True},
+        daemon=True,
+    )
+    _ui_port = port
+    _ui_thread.start()
+    return True
+
+
+def _text(text: str) -> list[TextContent]:
+    """Wrap text as a tool result."""
+    return [TextContent(type="text", text=text)]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available Branch Monkey tools."""
+    return _TOOLS
+
+
+def _dispatch(
+    name: str, arguments: dict[str, Any], monkey: "BranchMonkey", repo_path: Path
+) -> list[TextContent]:
+    """
+    Run a single tool call.
+
+    Args:
+        name: Tool name
+        arguments: Tool arguments
+        monkey: BranchMonkey instance for the repository
+        repo_path: Path to the repository
+
+    Returns:
+        The tool's text output
+    """
+    if name == "monkey_ui":
+        api_port = arguments.get("port", 8081)
+        frontend_port = 5176
+        # Start the API server in the background
+        if not _start_ui_server(repo_path, api_port):
+            if _ui_thread is None:
+                return _text(
+                    f"Port {_ui_port} is already in use (is Branch Monkey already running?)\n\nOpen the UI at: http://localhost:{frontend_port}"
+                )
+            return _text(
+                f"Branch Monkey API already running on port {_ui_port}\n\nOpen the UI at: http://localhost:{frontend_port}"
             )
-            return [TextContent(
-                type="text",
-                text=f"Branch Monkey API starting on port {api_port}\n\nOpen the UI at: http://localhost:{frontend_port}\n\nThe web interface provides:\n- Visual commit tree\n- Experiment management\n- Context library\n- Checkpoint controls"
-            )]
-
-        elif name == "monkey_status":
-            has_changes = monkey.has_changes()
-            experiment = monkey.current_experiment()
-            recent = monkey.list_saves(limit=3)
-
-            status_lines = []
-            if experiment:
-                status_lines.append(f"🔬 In experiment: {experiment['name']}")
-                if experiment.get('description'):
-                    status_lines.append(f"   {experiment['description']}")
-            else:
-                status_lines.append("📍 On main branch")
-
-            status_lines.append("")
-            if has_changes:
-                status_lines.append("✏️  You have unsaved changes")
-            else:
-                status_lines.append("✓ No unsaved changes")
-
-            if recent:
-                status_lines.append("\nRecent checkpoints:")
-                for cp in recent:
-                    status_lines.append(f"  • {cp['short_id']} ({cp['age']}): {cp['message'][:50]}")
-
-            return [TextContent(type="text", text="\n".join(status_lines))]
-
-        elif name == "monkey_save":
-            message = arguments["message"]
-            checkpoint = monkey.save(message)
-            return [TextContent(
-                type="text",
-                text=f"✓ Checkpoint created: {checkpoint['short_id']}\n  {checkpoint['message']}"
-            )]
-
-        elif name == "monkey_undo":
-            keep_changes = arguments.get("keep_changes", True)
-            monkey.undo(keep_changes=keep_changes)
-            msg = "✓ Restored to previous checkpoint"
-            if keep_changes:
-                msg += " (changes kept)"
-            return [TextContent(type="text", text=msg)]
-
-        elif name == "monkey_experiment_start":
-            name_arg = arguments["name"]
-            description = arguments.get("description", "")
-            experiment = monkey.try_something(name_arg, description)
-            return [TextContent(
-                type="text",
-                text=f"🔬 Experiment '{experiment['name']}' created and activated\n{description}"
-            )]
-
-        elif name == "monkey_experiment_keep":
-            monkey.keep_experiment()
-            return [TextContent(type="text", text="✓ Experiment merged successfully")]
-
-        elif name == "monkey_experiment_discard":
-            monkey.discard_experiment()
-            return [TextContent(type="text", text="✗ Experiment discarded")]
-
-        elif name == "monkey_context_prompt":
-            context_type = arguments["context_type"]
-            prompt = monkey.get_context_prompt(context_type)
-            return [TextContent(
-                type="text",
-                text=f"# AI Prompt for {context_type.title()} Summary\n\nRun the following analysis, then save the result with monkey_context_save:\n\n---\n\n{prompt}"
-            )]
-
-        elif name == "monkey_context_save":
-            context_type = arguments["context_type"]
-            content = arguments["content"]
-            entry = monkey.save_context_summary(context_type, content)
-            return [TextContent(
-                type="text",
-                text=f"✓ {context_type.title()} summary saved (ID: {entry['id']})\n  Created: {entry['created_at']}"
-            )]
-
-        elif name == "monkey_context_latest":
-            context_type = arguments["context_type"]
-            entry = monkey.get_latest_context(context_type)
-            if entry:
-                return [TextContent(
-                    type="text",
-                    text=f"# Latest {context_type.title()} Summary\n\nCreated: {entry['created_at']}\n\n---\n\n{entry['content']}"
-                )]
-            else:
-                return [TextContent(
+        return _text(
+            f"Branch Monkey API starting on port {api_port}\n\nOpen the UI at: http://localhost:{frontend_port}\n\nThe web interface provides:\n- Visual commit tree\n- Experiment management\n- Context library\n- Checkpoint controls"
+        )
+
+    elif name == "monkey_status":
+        has_changes = monkey.has_changes()
+        experiment = monkey.current_experiment()
+        # Checkpoint objects rather than list_saves() dicts; only the id, age and
+        # message are shown, so the per-commit diff stats are skipped
+        recent = monkey.checkpoints.list_checkpoints(3, with_stats=False)
+
+        status_lines = []
+        if experiment:
+            status_lines.append(f"🔬 In experiment: {experiment['name']}")
+            if experiment.get('description'):
+                status_lines.append(f"   {experiment['description']}")
+        else:
+            status_lines.append("📍 On main branch")
+
+        status_lines.append("")
+        if has_changes:
+            status_lines.append("✏️  You have unsaved changes")
+        else:
+            status_lines.append("✓ No unsaved changes")
+
+        if recent:
+            status_lines.append("\nRecent checkpoints:")
+            for cp in recent:
+                status_lines.append(f"  • {cp.short_id} ({cp.age}): {cp.message[:50]}")
+
+        return _text("\n".join(status_lines))
+
+    elif name == "monkey_save":
+        message = arguments["message"]
+        checkpoint = monkey.save(message)
+        return _text(f"✓ Checkpoint created: {checkpoint['short_id']}\n  {checkpoint['message']}")
+
+    elif name == "monkey_undo":
+        keep_changes = arguments.get("keep_changes", True)
+        monkey.undo(keep_changes=keep_changes)
+        msg = "✓ Restored to previous checkpoint"
+        if keep_changes:
+            msg += " (changes kept)"
+        return _text(msg)
+
+    elif name == "monkey_experiment_start":
+        name_arg = arguments["name"]
+        description = arguments.get("description", "")
+        experiment = monkey.try_something(name_arg, description)
+        return _text(f"🔬 Experiment '{experiment['name']}' created and activated\n{description}")
+
+    elif name == "monkey_experiment_keep":
+        monkey.keep_experiment()
+        return _text("✓ Experiment merged successfully")
+
+    elif name == "monkey_experiment_discard":
+        monkey.discard_experiment()
+        return _text("✗ Experiment discarded")
+
+    elif name == "monkey_context_prompt":
+        context_type = arguments["context_type"]
+        prompt = monkey.get_context_prompt(context_type)
+        return _text(
+            f"# AI Prompt for {context_type.title()} Summary\n\nRun the following analysis, then save the result with monkey_context_save:\n\n---\n\n{prompt}"
+        )
+
+    elif name == "monkey_context_save":
+        context_type = arguments["context_type"]
+        content = arguments["content"]
+        entry = monkey.save_context_summary(context_type, content)
+        return _text(
+            f"✓ {context_type.title()} summary saved (ID: {entry['id']})\n  Created: {entry['created_at']}"
+        )
+
+    elif name == "monkey_context_latest":
+        context_type = arguments["context_type"]
+        entry = monkey.get_latest_context(context_type)
+        if entry:
+            return _text(
+                f"# Latest {context_type.title()} Summary\n\nCreated: {entry['created_at']}\n\n---\n\n{entry['content']}"
+            )
+        else:
+            return _text(
+                f"No {context_type} summary found. Use monkey_context_prompt to generate one."
+            )
+
+    elif name == "monkey_history":
+        limit = arguments.get("limit", 10)
+        # HistoryEntry objects rather than what_happened() dicts, which copy
+        # every entry's file changes and evaluate all of its properties
+        history = monkey.history.get_history(limit)
+
+        lines = ["# Recent History\n"]
+        for entry in history:
+            summary = entry.message.partition("\n")[0][:60]
+            lines.append(f"• {entry.short_sha} ({entry.age}) - {entry.author}\n  {summary}\n")
+
+        return _text("\n".join(lines))
+
+    else:
+        return _text(f"Unknown tool: {name}")
+
+
+def _run_batch(
+    arguments: dict[str, Any], monkey: "BranchMonkey", repo_path: Path
+) -> list[TextContent]:
+    """
+    Run the calls of a monkey_batch request in order, sharing one BranchMonkey.
+
+    Args:
+        arguments: monkey_batch arguments (calls, stop_on_error)
+        monkey: BranchMonkey instance for the repository
+        repo_path: Path to the repository
+
+    Returns:
+        One text output per call that ran, headed by its position and tool name
+    """
+    calls = arguments["calls"]
+    stop_on_error = arguments.get("stop_on_error", False)
+
+    results = []
+    for i, call in enumerate(calls, 1):
+        call_name = call.get("name", "")
+        if call_name == "monkey_batch":
+            texts = _text("Error: monkey_batch calls can't be nested")
+            failed = True
+        else:
+            try:
+                texts = _dispatch(call_name, call.get("arguments") or {}, monkey, repo_path)
+                failed = False
+            except Exception as e:
+                texts = _text(f"Error: {str(e)}")
+                failed = True
+
+        for content in texts:
+            results.append(TextContent(type="text", text=f"[{i}] {call_name}\n{content.text}"))
+        if failed and stop_on_error:
+            skipped = len(calls) - i
+            if skipped:
+                results.append(TextContent(
                     type="text",
-                    text=f"No {context_type} summary found. Use monkey_context_prompt to generate one."
-                )]
+                    text=f"Stopped after call {i} failed; {skipped} call(s) not run"
+                ))
+            break
 
-        elif name == "monkey_history":
-            limit = arguments.get("limit", 10)
-            history = monkey.what_happened(limit)
+    return results
 
-            lines = ["# Recent History\n"]
-            for entry in history:
-                lines.append(f"• {entry['short_sha']} ({entry['age']}) - {entry['author']}")
-                lines.append(f"  {entry['message'].split(chr(10))[0][:60]}")
-                lines.append("")
 
-            return [TextContent(type="text", text="\n".join(lines))]
+@server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls."""
+    try:
+        repo_path = get_repo_path()
+        monkey = _get_monkey(repo_path)
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        if name == "monkey_batch":
+            return _run_batch(arguments, monkey, repo_path)
+        return _dispatch(name, arguments, monkey, repo_path)
 
     except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        return _text(f"Error: {str(e)}")
 
 
 async def _async_main():
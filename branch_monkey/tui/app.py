@@ -17,109 +17,11 @@ from .screens.checkpoints import CheckpointsScreen
 from .screens.experiments import ExperimentsScreen
 
 
-class Welcome(Static):
-    """Welcome message widget."""
-
-    def compose(self) -> ComposeResult:
-        yield Static(
-            """[bold cyan]🐵 Branch Monkey[/bold cyan]
-
-[dim]Git for humans - visual, safe, and beginner-friendly[/dim]
-
-[yellow]Quick Start:[/yellow]
-• [bold]Tab 1:[/bold] Timeline - See what happened
-• [bold]Tab 2:[/bold] Checkpoints - Save points you can restore
-• [bold]Tab 3:[/bold] Experiments - Safe places to try things
-
-[dim]Press ? for help • Press q to quit[/dim]
-"""
-        )
-
-
 class BranchMonkeyApp(App):
     """Main Branch Monkey TUI application."""
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    TabbedContent {
-        height: 100%;
-    }
-
-    TabPane {
-        padding: 1 2;
-    }
-
-    Welcome {
-        padding: 2 4;
-        border: solid $primary;
-        background: $surface;
-    }
-
-    .help-text {
-        color: $text-muted;
-        text-style: italic;
-    }
-
-    .success {
-        color: $success;
-    }
-
-    .warning {
-        color: $warning;
-    }
-
-    .error {
-        color: $error;
-    }
-
-    .highlight {
-        background: $primary 20%;
-        color: $text;
-    }
-
-    /* Graph view styling */
-    CommitLine {
-        padding: 0 1;
-    }
-
-    CommitLine.selected {
-        background: $accent 40%;
-        color: $text;
-        text-style: bold;
-    }
-
-    .connector {
-        color: $text-muted;
-    }
-
-    GraphView {
-        height: 100%;
-        border: solid $primary;
-    }
-
-    /* Confirm dialog */
-    #confirm_dialog {
-        width: 60;
-        height: auto;
-        background: $surface;
-        border: thick $warning;
-        padding: 2;
-    }
-
-    .confirm_message {
-        text-align: center;
-        padding: 1;
-    }
-
-    .button_row {
-        align: center middle;
-        padding: 1;
-        height: auto;
-    }
-    """
+    # Stylesheet in a file next to this module, loaded by Textual from CSS_PATH
+    CSS_PATH = "app.tcss"
 
     TITLE = "Branch Monkey"
     SUB_TITLE = "Git for humans"
@@ -134,15 +36,17 @@ class BranchMonkeyApp(App):
         Binding("r", "refresh", "Refresh"),
     ]
 
-    def __init__(self, repo_path: Optional[Path] = None):
+    def __init__(self, repo_path: Optional[Path] = None, graph_limit: int = 50):
         """
         Initialize app.
 
         Args:
             repo_path: Path to Git repository
+            graph_limit: Most commits to show in the graph
         """
         super().__init__()
         self.repo_path = repo_path or Path.cwd()
+        self.graph_limit = graph_limit
 
         # Initialize managers
         try:
@@ -170,7 +74,7 @@ class BranchMonkeyApp(App):
             yield TabbedContent(
                 TabPane(
                     "Graph",
-                    GraphScreen(self.repo_path),
+                    GraphScreen(self.repo_path, limit=self.graph_limit),
                     id="graph",
                 ),
                 TabPane(
@@ -202,7 +106,9 @@ class BranchMonkeyApp(App):
         # Get active tab and refresh it
         tabs = self.query_one(TabbedContent)
         active_pane = tabs.get_pane(tabs.active)
-        if hasattr(active_pane, "refresh_data"):
+        if hasattr(active_pane, "schedule_refresh"):
+            active_pane.schedule_refresh()
+        elif hasattr(active_pane, "refresh_data"):
             active_pane.refresh_data()
 
     def action_help(self) -> None:
@@ -210,12 +116,13 @@ class BranchMonkeyApp(App):
         self.push_screen("help")
 
 
-def run_tui(repo_path: Optional[Path] = None) -> None:
+def run_tui(repo_path: Optional[Path] = None, graph_limit: int = 50) -> None:
     """
     Run the Branch Monkey TUI.
 
     Args:
         repo_path: Path to Git repository
+        graph_limit: Most commits to show in the graph
     """
-    app = BranchMonkeyApp(repo_path)
+    app = BranchMonkeyApp(repo_path, graph_limit=graph_limit)
     app.run()
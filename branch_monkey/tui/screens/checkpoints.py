@@ -1,13 +1,74 @@
 """Checkpoints screen - manage save points."""
 
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll, Horizontal
 from textual.widgets import Static, Button, Input, ListView, ListItem, Label
 from textual.binding import Binding
 from textual.screen import ModalScreen
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from rich.text import Text
 
 from ...core.checkpoint import CheckpointManager, Checkpoint
+from ..widgets import LazyListView
+
+
+# Fixed text of the screen and its modal, parsed from markup once at import
+_HEADER = Text.from_markup(
+    "[bold]💾 Checkpoints[/bold]\n[dim]Save points you can restore to[/dim]\n"
+)
+_HELP = Text.from_markup("\n[dim]n: New • t: Quick Save • r: Restore • Del: Delete[/dim]")
+_TEMP_TITLE = Text.from_markup("\n[bold yellow]Quick Saves (Temporary)[/bold yellow]")
+_CHECKPOINTS_TITLE = Text.from_markup("\n[bold green]Checkpoints (Permanent)[/bold green]")
+_MODAL_TITLE = Text.from_markup("[bold]Create Checkpoint[/bold]\n")
+_MODAL_HELP = Text.from_markup("\n[dim]Enter: Save • Esc: Cancel[/dim]")
+
+
+# The header and stats lines depend only on these few fields, so the Text
+# for each is built once and reused when the lists are repopulated. The
+# cached Text objects are shared between items and must not be modified.
+@lru_cache(maxsize=512)
+def _checkpoint_header(short_id: str, is_temporary: bool, age: str) -> Text:
+    """Build the header line of a checkpoint list item."""
+    header = Text()
+
+    if is_temporary:
+        header.append("⏱️  ", style="")
+        header.append("TEMP ", style="bold yellow")
+    else:
+        header.append("✓ ", style="green")
+
+    header.append(f"{short_id} ", style="bold cyan")
+    header.append(f"({age})", style="dim")
+    return header
+
+
+@lru_cache(maxsize=512)
+def _checkpoint_stats(files_changed: int, insertions: int, deletions: int) -> Text:
+    """Build the stats line of a checkpoint list item."""
+    stats_parts = []
+    if files_changed > 0:
+        stats_parts.append(f"{files_changed} file{'s' if files_changed != 1 else ''}")
+    if insertions > 0:
+        stats_parts.append(f"+{insertions}")
+    if deletions > 0:
+        stats_parts.append(f"-{deletions}")
+
+    return Text(", ".join(stats_parts) or "No changes", style="dim")
+
+
+def _checkpoint_key(checkpoint: Checkpoint) -> tuple:
+    """Everything a checkpoint list item shows, to tell when it must be rebuilt."""
+    return (
+        checkpoint.id, checkpoint.is_temporary, checkpoint.age, checkpoint.message,
+        checkpoint.files_changed, checkpoint.insertions, checkpoint.deletions,
+    )
 
 
 class CheckpointListItem(ListItem):
@@ -19,55 +80,47 @@ class CheckpointListItem(ListItem):
 
     def compose(self) -> ComposeResult:
         """Compose the list item."""
-        # Create header
-        header = Text()
-
-        if self.checkpoint.is_temporary:
-            header.append("⏱️  ", style="")
-            header.append("TEMP ", style="bold yellow")
-        else:
-            header.append("✓ ", style="green")
-
-        header.append(f"{self.checkpoint.short_id} ", style="bold cyan")
-        header.append(f"({self.checkpoint.age})", style="dim")
+        checkpoint = self.checkpoint
+        header = _checkpoint_header(checkpoint.short_id, checkpoint.is_temporary, checkpoint.age)
 
         # Message
-        message = Text(self.checkpoint.message)
+        message = Text(checkpoint.message)
 
-        # Stats
-        stats_parts = []
-        if self.checkpoint.files_changed > 0:
-            stats_parts.append(
-                f"{self.checkpoint.files_changed} file{'s' if self.checkpoint.files_changed != 1 else ''}"
-            )
-        if self.checkpoint.insertions > 0:
-            stats_parts.append(f"+{self.checkpoint.insertions}")
-        if self.checkpoint.deletions > 0:
-            stats_parts.append(f"-{self.checkpoint.deletions}")
-
-        stats = Text(", ".join(stats_parts) if stats_parts else "No changes", style="dim")
+        stats = _checkpoint_stats(
+            checkpoint.files_changed, checkpoint.insertions, checkpoint.deletions
+        )
 
-        yield Static(header)
-        yield Static(message)
-        yield Static(stats)
+        # One Static for all three lines keeps the widget count per item down
+        yield Static(Text.assemble(header, "\n", message, "\n", stats))
 
 
 class CreateCheckpointModal(ModalScreen):
-    """Modal for creating a checkpoint."""
+    """
+    Modal for creating a checkpoint.
+
+    Installed on the app once and pushed by name, so it is composed once
+    and reused; it starts out empty each time it's shown.
+    """
 
     def compose(self) -> ComposeResult:
         """Compose the modal."""
         yield Container(
-            Static("[bold]Create Checkpoint[/bold]\n"),
+            Static(_MODAL_TITLE),
             Input(placeholder="Description of what you're saving", id="checkpoint_message"),
             Horizontal(
                 Button("Save", variant="primary", id="save_btn"),
                 Button("Cancel", variant="default", id="cancel_btn"),
             ),
-            Static("\n[dim]Enter: Save • Esc: Cancel[/dim]"),
+            Static(_MODAL_HELP),
             id="modal_container",
         )
 
+    def on_screen_resume(self) -> None:
+        """Clear what was typed the last time the modal was shown."""
+        message_input = self.query_one("#checkpoint_message", Input)
+        message_input.value = ""
+        message_input.focus()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
         if event.button.id == "save_btn":
@@ -99,17 +152,22 @@ class CheckpointsScreen(Static):
         Binding("delete", "delete_checkpoint", "Delete"),
     ]
 
+    REFRESH_DELAY = 0.05  # Seconds to wait for more refresh requests
+
     def __init__(self, checkpoint_mgr: CheckpointManager):
         super().__init__()
         self.checkpoint_mgr = checkpoint_mgr
         self.checkpoints = []
         self.temp_checkpoints = []
+        # Refresh workers that overlap take turns with the manager's repo
+        self._load_lock = threading.Lock()
+        self._refresh_timer: Optional[Timer] = None
+        # State the lists were last loaded from (see _signature)
+        self._last_signature: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         """Compose the screen."""
-        yield Static(
-            "[bold]💾 Checkpoints[/bold]\n[dim]Save points you can restore to[/dim]\n"
-        )
+        yield Static(_HEADER)
 
         yield Horizontal(
             Button("➕ New Checkpoint", variant="primary", id="new_checkpoint_btn"),
@@ -117,61 +175,82 @@ class CheckpointsScreen(Static):
             id="button_bar",
         )
 
-        yield Static("\n[bold yellow]Quick Saves (Temporary)[/bold yellow]")
+        yield Static(_TEMP_TITLE)
         yield VerticalScroll(
-            ListView(id="temp_list"),
+            LazyListView(id="temp_list"),
             id="temp_scroll",
         )
 
-        yield Static("\n[bold green]Checkpoints (Permanent)[/bold green]")
+        yield Static(_CHECKPOINTS_TITLE)
         yield VerticalScroll(
-            ListView(id="checkpoint_list"),
+            LazyListView(id="checkpoint_list"),
             id="checkpoint_scroll",
         )
 
-        yield Static(
-            "\n[dim]n: New • t: Quick Save • r: Restore • Del: Delete[/dim]",
-            id="help_text",
-        )
+        yield Static(_HELP, id="help_text")
 
     def on_mount(self) -> None:
         """When screen is mounted, load checkpoints."""
         self.refresh_data()
 
+    def schedule_refresh(self) -> None:
+        """Refresh shortly, folding a burst of requests into one refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self.refresh_data)
+
+    @work(thread=True, exclusive=True, group="refresh")
     def refresh_data(self) -> None:
-        """Refresh checkpoint data."""
+        """Refresh checkpoint data (git is read on a worker thread)."""
+        worker = get_current_worker()
         try:
-            self.checkpoints = self.checkpoint_mgr.list_checkpoints(limit=20)
-            self.temp_checkpoints = self.checkpoint_mgr.list_temporary()
-            self._populate_lists()
+            with self._load_lock:
+                signature = self._signature()
+                if signature == self._last_signature:
+                    return  # Nothing the lists show has changed
+                checkpoints = self.checkpoint_mgr.list_checkpoints(limit=20)
+                temp_checkpoints = self.checkpoint_mgr.list_temporary()
         except Exception as e:
-            self.notify(f"Error loading checkpoints: {e}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Error loading checkpoints: {e}", severity="error"
+            )
+            return
+        # A newer refresh has started; its results replace these
+        if not worker.is_cancelled:
+            self.app.call_from_thread(
+                self._show_data, checkpoints, temp_checkpoints, signature
+            )
+
+    def _signature(self) -> tuple:
+        """The checkpoints' state, and the minute (ages are shown to the minute)."""
+        return self.checkpoint_mgr.tip_hash(), int(time.time()) // 60
+
+    def _show_data(self, checkpoints: list, temp_checkpoints: list, signature: tuple) -> None:
+        """Show loaded checkpoints (on the UI thread)."""
+        self._last_signature = signature
+        self.checkpoints = checkpoints
+        self.temp_checkpoints = temp_checkpoints
+        self._populate_lists()
 
     def _populate_lists(self) -> None:
         """Populate checkpoint lists."""
         # Populate temporary checkpoints
-        temp_list = self.query_one("#temp_list", ListView)
-        temp_list.clear()
-
-        if not self.temp_checkpoints:
-            temp_list.append(
-                ListItem(Label("[dim]No quick saves yet[/dim]"))
-            )
-        else:
-            for checkpoint in self.temp_checkpoints:
-                temp_list.append(CheckpointListItem(checkpoint))
+        temp_list = self.query_one("#temp_list", LazyListView)
+        temp_list.set_source(
+            self.temp_checkpoints,
+            CheckpointListItem,
+            lambda: ListItem(Label("[dim]No quick saves yet[/dim]")),
+            key=_checkpoint_key,
+        )
 
         # Populate permanent checkpoints
-        checkpoint_list = self.query_one("#checkpoint_list", ListView)
-        checkpoint_list.clear()
-
-        if not self.checkpoints:
-            checkpoint_list.append(
-                ListItem(Label("[dim]No checkpoints yet. Create one![/dim]"))
-            )
-        else:
-            for checkpoint in self.checkpoints:
-                checkpoint_list.append(CheckpointListItem(checkpoint))
+        checkpoint_list = self.query_one("#checkpoint_list", LazyListView)
+        checkpoint_list.set_source(
+            self.checkpoints,
+            CheckpointListItem,
+            lambda: ListItem(Label("[dim]No checkpoints yet. Create one![/dim]")),
+            key=_checkpoint_key,
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
@@ -193,11 +272,13 @@ class CheckpointsScreen(Static):
                     self.notify(
                         f"Checkpoint created: {checkpoint.short_id}", severity="success"
                     )
-                    self.refresh_data()
+                    self.schedule_refresh()
                 except Exception as e:
                     self.notify(f"Error creating checkpoint: {e}", severity="error")
 
-        self.app.push_screen(CreateCheckpointModal(), handle_result)
+        if not self.app.is_screen_installed("create_checkpoint"):
+            self.app.install_screen(CreateCheckpointModal(), name="create_checkpoint")
+        self.app.push_screen("create_checkpoint", handle_result)
 
     def action_new_temp(self) -> None:
         """Create a quick save (temporary checkpoint)."""
@@ -208,7 +289,7 @@ class CheckpointsScreen(Static):
         try:
             checkpoint = self.checkpoint_mgr.create_temporary("Quick save")
             self.notify("Quick save created", severity="success")
-            self.refresh_data()
+            self.schedule_refresh()
         except Exception as e:
             self.notify(f"Error creating quick save: {e}", severity="error")
 
@@ -245,7 +326,7 @@ class CheckpointsScreen(Static):
             self.notify(
                 f"Restored to {checkpoint.short_id} (changes kept)", severity="success"
             )
-            self.refresh_data()
+            self.schedule_refresh()
         except Exception as e:
             self.notify(f"Error restoring: {e}", severity="error")
 
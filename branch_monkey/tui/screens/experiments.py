@@ -1,13 +1,78 @@
 """Experiments screen - manage safe branches."""
 
+import threading
+from functools import lru_cache
+from typing import Optional
+
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll, Horizontal
 from textual.widgets import Static, Button, Input, ListView, ListItem, Label
 from textual.binding import Binding
 from textual.screen import ModalScreen
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from rich.text import Text
 
 from ...core.experiment import ExperimentManager, Experiment
+from ..widgets import LazyListView
+
+
+# Titles and help lines, parsed once here instead of in every compose()
+_HEADER = Text.from_markup(
+    "[bold]🔬 Experiments[/bold]\n[dim]Safe places to try new things[/dim]\n"
+)
+_HELP = Text.from_markup("\n[dim]n: New • Enter: Switch • m: Merge • Del: Delete[/dim]")
+_LIST_TITLE = Text.from_markup("\n[bold]Your Experiments[/bold]")
+_MODAL_TITLE = Text.from_markup("[bold]Create Experiment[/bold]\n")
+_MODAL_HELP = Text.from_markup("\n[dim]Enter: Create • Esc: Cancel[/dim]")
+
+
+# The header and details lines depend only on these few fields, so the
+# Text for each is built once and reused when the list is repopulated. The
+# cached Text objects are shared between items and must not be modified.
+@lru_cache(maxsize=512)
+def _experiment_header(name: str, is_active: bool, status: str, age: str) -> Text:
+    """Build the header line of an experiment list item."""
+    header = Text()
+
+    # Status icon
+    if is_active:
+        header.append("🔬 ", style="")
+    else:
+        header.append("⚗️  ", style="")
+
+    # Name
+    header.append(f"{name} ", style="bold cyan")
+
+    # Status
+    header.append(f"{status}", style="")
+
+    # Age
+    header.append(f" ({age})", style="dim")
+    return header
+
+
+@lru_cache(maxsize=512)
+def _experiment_details(base_branch: str, commits_ahead: int, commits_behind: int) -> Text:
+    """Build the details line of an experiment list item."""
+    details_parts = []
+    details_parts.append(f"Based on: {base_branch}")
+    if commits_ahead > 0:
+        details_parts.append(f"{commits_ahead} commits ahead")
+    if commits_behind > 0:
+        details_parts.append(f"{commits_behind} commits behind")
+
+    return Text(" • ".join(details_parts), style="dim")
+
+
+def _experiment_key(experiment: Experiment) -> tuple:
+    """Everything an experiment list item shows, to tell when it must be rebuilt."""
+    return (
+        experiment.name, experiment.is_active, experiment.status, experiment.age,
+        experiment.description, experiment.base_branch,
+        experiment.commits_ahead, experiment.commits_behind,
+    )
 
 
 class ExperimentListItem(ListItem):
@@ -19,61 +84,53 @@ class ExperimentListItem(ListItem):
 
     def compose(self) -> ComposeResult:
         """Compose the list item."""
-        # Create header
-        header = Text()
-
-        # Status icon
-        if self.experiment.is_active:
-            header.append("🔬 ", style="")
-        else:
-            header.append("⚗️  ", style="")
-
-        # Name
-        header.append(f"{self.experiment.name} ", style="bold cyan")
-
-        # Status
-        header.append(f"{self.experiment.status}", style="")
-
-        # Age
-        header.append(f" ({self.experiment.age})", style="dim")
+        experiment = self.experiment
+        header = _experiment_header(
+            experiment.name, experiment.is_active, experiment.status, experiment.age
+        )
 
         # Description
         description = Text(
-            self.experiment.description or "[dim]No description[/dim]"
+            experiment.description or "[dim]No description[/dim]"
         )
 
-        # Details
-        details_parts = []
-        details_parts.append(f"Based on: {self.experiment.base_branch}")
-        if self.experiment.commits_ahead > 0:
-            details_parts.append(f"{self.experiment.commits_ahead} commits ahead")
-        if self.experiment.commits_behind > 0:
-            details_parts.append(f"{self.experiment.commits_behind} commits behind")
-
-        details = Text(" • ".join(details_parts), style="dim")
+        details = _experiment_details(
+            experiment.base_branch, experiment.commits_ahead, experiment.commits_behind
+        )
 
-        yield Static(header)
-        yield Static(description)
-        yield Static(details)
+        # One Static for all three lines keeps the widget count per item down
+        yield Static(Text.assemble(header, "\n", description, "\n", details))
 
 
 class CreateExperimentModal(ModalScreen):
-    """Modal for creating an experiment."""
+    """
+    Modal for creating an experiment.
+
+    Installed on the app once and pushed by name, so it is composed once
+    and reused; it starts out empty each time it's shown.
+    """
 
     def compose(self) -> ComposeResult:
         """Compose the modal."""
         yield Container(
-            Static("[bold]Create Experiment[/bold]\n"),
+            Static(_MODAL_TITLE),
             Input(placeholder="Experiment name (e.g., 'new-feature')", id="exp_name"),
             Input(placeholder="What are you trying? (optional)", id="exp_description"),
             Horizontal(
                 Button("Create", variant="primary", id="create_btn"),
                 Button("Cancel", variant="default", id="cancel_btn"),
             ),
-            Static("\n[dim]Enter: Create • Esc: Cancel[/dim]"),
+            Static(_MODAL_HELP),
             id="modal_container",
         )
 
+    def on_screen_resume(self) -> None:
+        """Clear what was typed the last time the modal was shown."""
+        self.query_one("#exp_description", Input).value = ""
+        name_input = self.query_one("#exp_name", Input)
+        name_input.value = ""
+        name_input.focus()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
         if event.button.id == "create_btn":
@@ -117,61 +174,75 @@ class ExperimentsScreen(Static):
         Binding("delete", "delete_experiment", "Delete"),
     ]
 
+    REFRESH_DELAY = 0.05  # Seconds to wait for more refresh requests
+
     def __init__(self, experiment_mgr: ExperimentManager):
         super().__init__()
         self.experiment_mgr = experiment_mgr
         self.experiments = []
+        # Refresh workers that overlap take turns with the manager's repo
+        self._load_lock = threading.Lock()
+        self._refresh_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Compose the screen."""
-        yield Static(
-            "[bold]🔬 Experiments[/bold]\n[dim]Safe places to try new things[/dim]\n"
-        )
+        yield Static(_HEADER)
 
         yield Horizontal(
             Button("➕ New Experiment", variant="primary", id="new_exp_btn"),
             id="button_bar",
         )
 
-        yield Static("\n[bold]Your Experiments[/bold]")
+        yield Static(_LIST_TITLE)
         yield VerticalScroll(
-            ListView(id="experiment_list"),
+            LazyListView(id="experiment_list"),
             id="scroll_container",
         )
 
-        yield Static(
-            "\n[dim]n: New • Enter: Switch • m: Merge • Del: Delete[/dim]",
-            id="help_text",
-        )
+        yield Static(_HELP, id="help_text")
 
     def on_mount(self) -> None:
         """When screen is mounted, load experiments."""
         self.refresh_data()
 
+    def schedule_refresh(self) -> None:
+        """Refresh shortly, folding a burst of requests into one refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self.refresh_data)
+
+    @work(thread=True, exclusive=True, group="refresh")
     def refresh_data(self) -> None:
-        """Refresh experiment data."""
+        """Refresh experiment data (git is read on a worker thread)."""
+        worker = get_current_worker()
         try:
-            self.experiments = self.experiment_mgr.list_experiments()
-            self._populate_list()
+            with self._load_lock:
+                experiments = self.experiment_mgr.list_experiments()
         except Exception as e:
-            self.notify(f"Error loading experiments: {e}", severity="error")
+            self.app.call_from_thread(
+                self.notify, f"Error loading experiments: {e}", severity="error"
+            )
+            return
+        # A newer refresh has started; its results replace these
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._show_data, experiments)
+
+    def _show_data(self, experiments: list) -> None:
+        """Show loaded experiments (on the UI thread)."""
+        self.experiments = experiments
+        self._populate_list()
 
     def _populate_list(self) -> None:
         """Populate experiment list."""
-        exp_list = self.query_one("#experiment_list", ListView)
-        exp_list.clear()
-
-        if not self.experiments:
-            exp_list.append(
-                ListItem(
-                    Label(
-                        "[dim]No experiments yet. Create one to try something new![/dim]"
-                    )
-                )
-            )
-        else:
-            for experiment in self.experiments:
-                exp_list.append(ExperimentListItem(experiment))
+        exp_list = self.query_one("#experiment_list", LazyListView)
+        exp_list.set_source(
+            self.experiments,
+            ExperimentListItem,
+            lambda: ListItem(
+                Label("[dim]No experiments yet. Create one to try something new![/dim]")
+            ),
+            key=_experiment_key,
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
@@ -190,11 +261,13 @@ class ExperimentsScreen(Static):
                         f"Experiment '{experiment.name}' created and activated",
                         severity="success",
                     )
-                    self.refresh_data()
+                    self.schedule_refresh()
                 except Exception as e:
                     self.notify(f"Error creating experiment: {e}", severity="error")
 
-        self.app.push_screen(CreateExperimentModal(), handle_result)
+        if not self.app.is_screen_installed("create_experiment"):
+            self.app.install_screen(CreateExperimentModal(), name="create_experiment")
+        self.app.push_screen("create_experiment", handle_result)
 
     def action_switch_experiment(self) -> None:
         """Switch to selected experiment."""
@@ -212,7 +285,7 @@ class ExperimentsScreen(Static):
                 self.notify(
                     f"Switched to experiment '{experiment.name}'", severity="success"
                 )
-                self.refresh_data()
+                self.schedule_refresh()
             except Exception as e:
                 self.notify(f"Error switching: {e}", severity="error")
         else:
@@ -238,7 +311,7 @@ class ExperimentsScreen(Static):
                     f"Experiment '{experiment.name}' merged successfully",
                     severity="success",
                 )
-                self.refresh_data()
+                self.schedule_refresh()
             except Exception as e:
                 self.notify(f"Error merging: {e}", severity="error")
         else:
@@ -263,7 +336,7 @@ class ExperimentsScreen(Static):
                 self.notify(
                     f"Experiment '{experiment.name}' deleted", severity="success"
                 )
-                self.refresh_data()
+                self.schedule_refresh()
             except Exception as e:
                 self.notify(f"Error deleting: {e}", severity="error")
         else:
@@ -1,62 +1,209 @@
 """Main graph screen - visual Git tree with navigation."""
 
-from typing import Optional, List
+import threading
+import time
+from typing import Optional, List, Tuple, Union
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll, Horizontal
 from textual.widgets import Static, Label, Button
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.screen import ModalScreen
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from rich.text import Text
 from rich.panel import Panel
 
 from ...core.graph import GitGraph, CommitNode, GraphLine
 
 
+# Markup for the screen's fixed text, parsed once rather than on every compose
+_HEADER = Text.from_markup(
+    "[bold cyan]🐵 Branch Monkey - Git Graph[/bold cyan]\n"
+    "[dim]Navigate with ↑/↓ arrows, Enter to jump to commit[/dim]\n"
+)
+_HELP = Text.from_markup(
+    "\n[dim]↑/↓: Navigate • Enter: Go to commit • n: New checkpoint • e: New experiment"
+    " • r: Refresh[/dim]"
+)
+
+
 class GraphView(VerticalScroll):
-    """Scrollable graph view."""
+    """
+    Scrollable graph view.
+
+    The first page of children is mounted with the view and the rest follow
+    a page per refresh, so the top of a large graph shows up right away.
+    """
+
+    PAGE_SIZE = 40  # Children (commit lines and connector blocks) per page
 
     selected_index = reactive(0)
 
     def __init__(self, graph_lines: List[GraphLine]):
         super().__init__()
+        self._set_lines(graph_lines)
+        self._commit_widgets: List[CommitLine] = []  # Filled in by compose
+        # Keys (see _runs) and widgets of the mounted children, in order
+        self._child_keys: List[tuple] = []
+        self._child_widgets: List[Static] = []
+        self._loading = False  # Pages of children still to be mounted
+
+    def _set_lines(self, graph_lines: List[GraphLine]) -> None:
+        """Set the lines shown, indexing the ones that have commits."""
         self.graph_lines = graph_lines
-        self.commit_indices = []  # Indices of lines that have commits
-
-        # Build index of commit lines
-        for i, line in enumerate(graph_lines):
-            if line.is_commit_line and line.commit_node:
-                self.commit_indices.append(i)
+        # Indices of lines that have commits, and those lines' commits
+        self.commit_indices = [
+            i for i, line in enumerate(graph_lines) if line.is_commit_line and line.commit_node
+        ]
+        self._commit_nodes = [graph_lines[i].commit_node for i in self.commit_indices]
 
     def compose(self) -> ComposeResult:
         """Compose the graph view."""
-        for i, line in enumerate(self.graph_lines):
+        runs = self._runs(self.graph_lines)
+        self._child_keys = [key for key, _ in runs]
+        self._child_widgets = [self._make_child(part) for _, part in runs]
+        self._collect_commit_widgets()
+        # Textual mounts everything compose returns as one batch
+        self._loading = len(self._child_widgets) > self.PAGE_SIZE
+        return self._child_widgets[: self.PAGE_SIZE]
+
+    def on_mount(self) -> None:
+        """Start mounting the children that didn't fit on the first page."""
+        if self._loading:
+            self.call_after_refresh(self._mount_page, self.PAGE_SIZE)
+
+    def _mount_page(self, start: int) -> None:
+        """Mount one page of children, scheduling the next page after the refresh."""
+        if not self.is_attached:
+            return  # Replaced by a newer graph
+        end = start + self.PAGE_SIZE
+        self.mount_all(self._child_widgets[start:end])
+        if end < len(self._child_widgets):
+            self.call_after_refresh(self._mount_page, end)
+        else:
+            self._loading = False
+
+    @staticmethod
+    def _runs(graph_lines: List[GraphLine]) -> List[Tuple[tuple, Union[int, List[str]]]]:
+        """
+        Split graph lines into the view's children.
+
+        Returns:
+            (key, part) per child, in order. part is a commit line's index,
+            or the texts of a run of connector lines. The key identifies
+            what the child shows: the commit and its text, or the commit
+            above the connectors and their text.
+        """
+        runs: List[Tuple[tuple, Union[int, List[str]]]] = []
+        connectors: List[str] = []  # Connector lines since the last commit line
+        above = None  # SHA of the last commit line
+        for i, line in enumerate(graph_lines):
             if line.is_commit_line and line.commit_node:
-                # This is a commit line - make it selectable
-                yield CommitLine(line, i, id=f"commit_{i}")
+                if connectors:
+                    runs.append((("connector", above, "\n".join(connectors)), connectors))
+                    connectors = []
+                above = line.commit_node.sha
+                runs.append((("commit", above, line.text), i))
             else:
-                # Regular connector line
-                yield Static(line.text, classes="connector")
+                connectors.append(line.text)
+        if connectors:
+            runs.append((("connector", above, "\n".join(connectors)), connectors))
+        return runs
+
+    def _make_child(self, part: Union[int, List[str]]) -> Static:
+        """Build the widget for one child returned by _runs."""
+        if isinstance(part, int):
+            # This is a commit line - make it selectable
+            return CommitLine(self.graph_lines[part], part)
+        # One Static for a run of consecutive connector lines
+        return Static(Text("\n".join(part)), classes="connector")
+
+    def _collect_commit_widgets(self) -> None:
+        """Index the commit lines among the children and highlight the selected one."""
+        self._commit_widgets = [
+            child for child in self._child_widgets if isinstance(child, CommitLine)
+        ]
+        for i, widget in enumerate(self._commit_widgets):
+            widget.set_class(i == self.selected_index, "selected")
+
+    def update_lines(self, graph_lines: List[GraphLine]) -> bool:
+        """
+        Show new graph lines, removing and mounting only the children that changed.
+
+        Args:
+            graph_lines: Lines of the newly rendered graph
+
+        Returns:
+            False if the view can't be updated in place and must be rebuilt
+        """
+        if self._loading:
+            return False  # Pages of the current graph still being mounted
+
+        runs = self._runs(graph_lines)
+        keys = [key for key, _ in runs]
+        old_keys = self._child_keys
+
+        if keys != old_keys:
+            new_set = set(keys)
+            old_set = set(old_keys)
+            if len(new_set) != len(keys) or len(old_set) != len(old_keys):
+                return False  # Duplicate keys can't be matched up
+            # Kept children must stay in the same relative order
+            if [k for k in old_keys if k in new_set] != [k for k in keys if k in old_set]:
+                return False
+
+            kept = {}
+            for old_key, child in zip(old_keys, self._child_widgets):
+                if old_key in new_set:
+                    kept[old_key] = child
+                else:
+                    child.remove()
+
+            self._set_lines(graph_lines)
+            children = []
+            pending = []  # New children waiting for the next kept child to mount before
+            for key, part in runs:
+                child = kept.get(key)
+                if child is None:
+                    child = self._make_child(part)
+                    pending.append(child)
+                elif pending:
+                    self.mount(*pending, before=child)
+                    pending = []
+                children.append(child)
+            if pending:
+                self.mount(*pending)
+            self._child_keys = keys
+            self._child_widgets = children
+        else:
+            self._set_lines(graph_lines)
+
+        # Kept commit lines now stand for the new graph's lines
+        for (_, part), child in zip(runs, self._child_widgets):
+            if isinstance(child, CommitLine):
+                child.graph_line = graph_lines[part]
+                child.index = part
+        self._collect_commit_widgets()
+        return True
 
     def watch_selected_index(self, old_value: int, new_value: int) -> None:
         """React to selection changes."""
         # Update highlighting
-        if 0 <= old_value < len(self.commit_indices):
-            old_line_index = self.commit_indices[old_value]
-            old_widget = self.query_one(f"#commit_{old_line_index}")
-            old_widget.remove_class("selected")
-
-        if 0 <= new_value < len(self.commit_indices):
-            new_line_index = self.commit_indices[new_value]
-            new_widget = self.query_one(f"#commit_{new_line_index}")
+        if 0 <= old_value < len(self._commit_widgets):
+            self._commit_widgets[old_value].remove_class("selected")
+
+        if 0 <= new_value < len(self._commit_widgets):
+            new_widget = self._commit_widgets[new_value]
             new_widget.add_class("selected")
-            new_widget.scroll_visible()
+            if new_widget.is_mounted:
+                new_widget.scroll_visible()
 
     def get_selected_commit(self) -> Optional[CommitNode]:
         """Get currently selected commit."""
-        if 0 <= self.selected_index < len(self.commit_indices):
-            line_index = self.commit_indices[self.selected_index]
-            return self.graph_lines[line_index].commit_node
+        if 0 <= self.selected_index < len(self._commit_nodes):
+            return self._commit_nodes[self.selected_index]
         return None
 
     def move_up(self) -> None:
@@ -91,53 +238,91 @@ class GraphScreen(Static):
         Binding("r", "refresh", "Refresh", show=True),
     ]
 
-    def __init__(self, repo_path=None):
+    REFRESH_DELAY = 0.05  # Seconds to wait for more refresh requests
+
+    def __init__(self, repo_path=None, limit: int = 50):
         super().__init__()
         self.graph = GitGraph(repo_path)
+        self.limit = limit  # Most commits to show
         self.nodes = []
         self.graph_view = None
+        # Refresh workers that overlap take turns with the graph's repo
+        self._load_lock = threading.Lock()
+        self._refresh_timer: Optional[Timer] = None
+        # State the graph was last built from (see _signature)
+        self._last_signature: Optional[tuple] = None
 
     def compose(self) -> ComposeResult:
         """Compose the screen."""
-        yield Static(
-            "[bold cyan]🐵 Branch Monkey - Git Graph[/bold cyan]\n"
-            "[dim]Navigate with ↑/↓ arrows, Enter to jump to commit[/dim]\n",
-            id="header",
-        )
+        yield Static(_HEADER, id="header")
 
         # Will be populated in on_mount
         yield Container(id="graph_container")
 
-        yield Static(
-            "\n[dim]↑/↓: Navigate • Enter: Go to commit • n: New checkpoint • e: New experiment • r: Refresh[/dim]",
-            id="help",
-        )
+        yield Static(_HELP, id="help")
 
     def on_mount(self) -> None:
         """When screen is mounted, build and display graph."""
         self.refresh_graph()
 
+    def schedule_refresh(self) -> None:
+        """Refresh shortly, folding a burst of requests into one refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(self.REFRESH_DELAY, self.refresh_graph)
+
+    @work(thread=True, exclusive=True, group="refresh")
     def refresh_graph(self) -> None:
-        """Rebuild and redisplay the graph."""
+        """Rebuild the graph on a worker thread, then redisplay it."""
+        worker = get_current_worker()
         try:
-            # Build graph
-            self.nodes = self.graph.build_graph(limit=50, all_branches=True)
+            with self._load_lock:
+                signature = self._signature()
+                if signature == self._last_signature:
+                    return  # Nothing the graph shows has changed
 
-            # Render graph
-            graph_lines = self.graph.render_graph(self.nodes, width=120)
+                # Build graph
+                nodes = self.graph.build_graph(limit=self.limit, all_branches=True)
+                head_index = self.graph.head_index
 
-            # Create graph view
-            container = self.query_one("#graph_container", Container)
-            container.remove_children()
+                # Render graph
+                graph_lines = self.graph.render_graph(nodes, width=120)
+        except Exception as e:
+            self.app.call_from_thread(
+                self.notify, f"Error loading graph: {e}", severity="error"
+            )
+            return
+        # A newer refresh has started; its graph replaces this one
+        if not worker.is_cancelled:
+            self.app.call_from_thread(
+                self._show_graph, nodes, graph_lines, head_index, signature
+            )
+
+    def _signature(self) -> tuple:
+        """The repository's refs, and the minute (ages are shown to the minute)."""
+        return self.graph.refs_signature(), int(time.time()) // 60
+
+    def _show_graph(
+        self,
+        nodes: List[CommitNode],
+        graph_lines: List[GraphLine],
+        head_index: Optional[int],
+        signature: tuple,
+    ) -> None:
+        """Display a built graph (on the UI thread)."""
+        self.nodes = nodes
+        try:
+            # Update the graph view in place, or create it
+            if self.graph_view is None or not self.graph_view.update_lines(graph_lines):
+                container = self.query_one("#graph_container", Container)
+                container.remove_children()
 
-            self.graph_view = GraphView(graph_lines)
-            container.mount(self.graph_view)
+                self.graph_view = GraphView(graph_lines)
+                container.mount(self.graph_view)
 
             # Select current HEAD if possible
-            for i, node in enumerate(self.nodes):
-                if node.is_head:
-                    self.graph_view.selected_index = i
-                    break
+            self.graph_view.selected_index = head_index if head_index is not None else 0
+            self._last_signature = signature
 
         except Exception as e:
             self.notify(f"Error loading graph: {e}", severity="error")
@@ -181,7 +366,7 @@ class GraphScreen(Static):
                     self.notify(
                         f"Switched to commit {commit.short_sha}", severity="success"
                     )
-                    self.refresh_graph()
+                    self.schedule_refresh()
                 except Exception as e:
                     self.notify(f"Error: {e}", severity="error")
 
@@ -195,7 +380,7 @@ class GraphScreen(Static):
 
     def action_refresh(self) -> None:
         """Refresh the graph."""
-        self.refresh_graph()
+        self.schedule_refresh()
         self.notify("Graph refreshed", severity="success")
 
     def _update_info(self) -> None:
@@ -13,6 +13,17 @@ from rich.panel import Panel
 from ...core.graph_horizontal import HorizontalGitGraph, CommitNode
 
 
+# The screen's header and help, parsed once at import
+_HEADER = Text.from_markup(
+    "[bold cyan]🐵 Branch Monkey - Git Graph (Horizontal)[/bold cyan]\n"
+    "[dim]↑/↓: Switch branches • ←/→: Switch tabs • Enter: Checkout[/dim]\n"
+)
+_HELP = Text.from_markup(
+    "\n[dim]↑/↓: Switch branches • Enter: Checkout • n: Save • e: Experiment"
+    " • r: Refresh[/dim]"
+)
+
+
 class HorizontalGraphView(Static):
     """Display horizontal Git graph."""
 
@@ -104,18 +115,11 @@ class HorizontalGraphScreen(Static):
 
     def compose(self) -> ComposeResult:
         """Compose the screen."""
-        yield Static(
-            "[bold cyan]🐵 Branch Monkey - Git Graph (Horizontal)[/bold cyan]\n"
-            "[dim]↑/↓: Switch branches • ←/→: Switch tabs • Enter: Checkout[/dim]\n",
-            id="header",
-        )
+        yield Static(_HEADER, id="header")
 
         yield Container(id="graph_container")
 
-        yield Static(
-            "\n[dim]↑/↓: Switch branches • Enter: Checkout • n: Save • e: Experiment • r: Refresh[/dim]",
-            id="help",
-        )
+        yield Static(_HELP, id="help")
 
     def on_mount(self) -> None:
         """When screen is mounted, build and display graph."""
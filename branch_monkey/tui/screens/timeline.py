@@ -7,6 +7,12 @@ from textual.binding import Binding
 from rich.text import Text
 
 from ...core.history import HistoryNavigator, HistoryEntry
+from ..widgets import LazyListView
+
+
+# Header and help line, parsed from markup once
+_HEADER = Text.from_markup("[bold]📜 Timeline[/bold]\n[dim]Project history[/dim]\n")
+_HELP = Text.from_markup("[dim]↑/↓: Navigate • Enter: Details • d: Diff • /: Search[/dim]")
 
 
 class HistoryListItem(ListItem):
@@ -77,16 +83,13 @@ class TimelineScreen(Static):
 
     def compose(self) -> ComposeResult:
         """Compose the screen."""
-        yield Static("[bold]📜 Timeline[/bold]\n[dim]Project history[/dim]\n")
+        yield Static(_HEADER)
         yield Input(placeholder="Search history... (press / to focus)", id="search_input")
         yield VerticalScroll(
-            ListView(id="history_list"),
+            LazyListView(id="history_list"),
             id="scroll_container",
         )
-        yield Static(
-            "[dim]↑/↓: Navigate • Enter: Details • d: Diff • /: Search[/dim]",
-            id="help_text",
-        )
+        yield Static(_HELP, id="help_text")
 
     def on_mount(self) -> None:
         """When screen is mounted, load history."""
@@ -95,6 +98,7 @@ class TimelineScreen(Static):
     def refresh_data(self) -> None:
         """Refresh history data."""
         try:
+            self.history_nav.refresh()
             self.entries = self.history_nav.get_history(limit=50)
             self._populate_list()
         except Exception as e:
@@ -102,17 +106,12 @@ class TimelineScreen(Static):
 
     def _populate_list(self) -> None:
         """Populate the history list."""
-        list_view = self.query_one("#history_list", ListView)
-        list_view.clear()
-
-        if not self.entries:
-            list_view.append(
-                ListItem(Label("[dim]No history yet. Make some checkpoints![/dim]"))
-            )
-            return
-
-        for entry in self.entries:
-            list_view.append(HistoryListItem(entry))
+        list_view = self.query_one("#history_list", LazyListView)
+        list_view.set_source(
+            self.entries,
+            HistoryListItem,
+            lambda: ListItem(Label("[dim]No history yet. Make some checkpoints![/dim]")),
+        )
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input."""
@@ -164,6 +163,10 @@ class TimelineScreen(Static):
 
     def _show_details(self, entry: HistoryEntry) -> None:
         """Show detailed view of an entry."""
+        # History listings leave merges without file changes; load them now
+        if entry.is_merge and not entry.files_changed:
+            entry.files_changed = self.history_nav.get_merge_changes(entry.sha)
+
         details = f"""[bold cyan]{entry.short_sha}[/bold cyan] by {entry.author}
 [dim]{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')} ({entry.age})[/dim]
 
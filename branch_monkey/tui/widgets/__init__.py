@@ -1,4 +1,5 @@
 """Custom TUI widgets."""
 
-# Placeholder for custom widgets
-# Can be extended later with custom components
+from .lazy_list import LazyListView
+
+__all__ = ["LazyListView"]
@@ -0,0 +1,136 @@
+"""List view that mounts its items a page at a time."""
+
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+
+from textual.widgets import ListItem, ListView
+
+
+class LazyListView(ListView):
+    """
+    ListView filled from a sequence of records rather than ready-made items.
+
+    Only the first page of items is built and mounted right away; the rest
+    follow a page per refresh, so the list is on screen before every
+    record has been turned into widgets. With a key function, setting a
+    new source only removes and mounts the items whose keys changed.
+    """
+
+    PAGE_SIZE = 20
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Bumped by set_source so pages of an older source stop being added
+        self._generation = 0
+        # Keys and items of the mounted records, in order (None: not tracked)
+        self._keys: Optional[List[Hashable]] = None
+        self._items: List[ListItem] = []
+        self._loading = False  # Pages of the current source still to be added
+
+    def set_source(
+        self,
+        records: Sequence[Any],
+        make_item: Callable[[Any], ListItem],
+        make_empty: Callable[[], ListItem],
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ) -> None:
+        """
+        Replace the list's items with items for records.
+
+        Args:
+            records: Records to show, in order
+            make_item: Builds the list item for a record
+            make_empty: Builds the placeholder item shown when there are no records
+            key: Identifies what a record's item shows; items whose key is
+                unchanged are kept instead of being rebuilt
+        """
+        keys = [key(record) for record in records] if key is not None else None
+        if keys and self._update_in_place(records, keys, make_item):
+            return
+
+        self._generation += 1
+        self._keys = [] if keys else None
+        self._items = []
+        self._loading = False
+        self.clear()
+        if not records:
+            self.append(make_empty())
+            return
+        self._loading = True
+        self._append_page(self._generation, records, keys, make_item, 0)
+
+    def _update_in_place(
+        self,
+        records: Sequence[Any],
+        keys: List[Hashable],
+        make_item: Callable[[Any], ListItem],
+    ) -> bool:
+        """
+        Turn the mounted items into the items for records by removing and
+        inserting only the ones whose keys changed.
+
+        Returns:
+            False if the list can't be updated in place and must be rebuilt
+        """
+        old_keys = self._keys
+        if not old_keys or self._loading:
+            return False  # Nothing tracked, or pages still being added
+        if keys == old_keys:
+            return True
+
+        new_set = set(keys)
+        old_set = set(old_keys)
+        if len(new_set) != len(keys) or len(old_set) != len(old_keys):
+            return False  # Duplicate keys can't be matched up
+        # Kept items must stay in the same relative order
+        if [k for k in old_keys if k in new_set] != [k for k in keys if k in old_set]:
+            return False
+
+        kept = {}
+        for old_key, item in zip(old_keys, self._items):
+            if old_key in new_set:
+                kept[old_key] = item
+            else:
+                item.remove()
+
+        items = []
+        pending = []  # New items waiting for the next kept item to mount before
+        for record, record_key in zip(records, keys):
+            item = kept.get(record_key)
+            if item is None:
+                item = make_item(record)
+                pending.append(item)
+            elif pending:
+                self.mount(*pending, before=item)
+                pending = []
+            items.append(item)
+        if pending:
+            self.mount(*pending)
+
+        self._keys = keys
+        self._items = items
+        if self.index is not None and self.index >= len(items):
+            self.index = len(items) - 1
+        return True
+
+    def _append_page(
+        self,
+        generation: int,
+        records: Sequence[Any],
+        keys: Optional[List[Hashable]],
+        make_item: Callable[[Any], ListItem],
+        start: int,
+    ) -> None:
+        """Append one page of items, scheduling the next page after the refresh."""
+        if generation != self._generation:
+            return
+        end = start + self.PAGE_SIZE
+        for record in records[start:end]:
+            item = make_item(record)
+            self.append(item)
+            self._items.append(item)
+        if keys is not None:
+            self._keys.extend(keys[start:end])
+        if end >= len(records):
+            self._loading = False
+        else:
+            self.call_after_refresh(self._append_page, generation, records, keys, make_item, end)
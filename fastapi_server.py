@@ -38,6 +38,11 @@ LOCAL_DB_NAME = "data.db"
 # Tasks JSON file name (stored in repo's .branch_monkey folder) - legacy, migrating to DB
 TASKS_JSON_FILENAME = "tasks.json"
 
+# Upper bound on matching directories collected when scanning a folder for
+# repos, so pointing the picker at a huge directory can't stall the request.
+# Responses say "truncated" when it was reached.
+MAX_FOLDER_SCAN_MATCHES = 5000
+
 
 def get_local_db_path() -> Path:
     """Get the path to the current repo's local database."""
@@ -2107,21 +2112,31 @@ def search_repo_paths(request: PathSearchRequest):
             search_dir = Path.cwd() / search_dir
 
         suggestions = []
+        truncated = False
+        prefix = prefix.lower()
 
         if search_dir.exists() and search_dir.is_dir():
             try:
-                # List directories
-                for item in sorted(search_dir.iterdir()):
-                    if item.is_dir() and not item.name.startswith('.'):
+                # List directories (DirEntry caches the file type, so is_dir()
+                # needs no extra stat for regular entries)
+                with os.scandir(search_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
                         # Filter by prefix if typing partial name
-                        if not prefix or item.name.lower().startswith(prefix.lower()):
-                            full_path = str(item)
-                            # Mark Git repos with a special indicator
-                            is_git_repo = (item / ".git").exists()
-                            suggestions.append({
-                                "path": full_path,
-                                "is_git_repo": is_git_repo
-                            })
+                        if prefix and not entry.name.lower().startswith(prefix):
+                            continue
+                        if not entry.is_dir():
+                            continue
+                        if len(suggestions) >= MAX_FOLDER_SCAN_MATCHES:
+                            truncated = True
+                            break
+                        # Mark Git repos with a special indicator
+                        is_git_repo = os.path.exists(os.path.join(entry.path, ".git"))
+                        suggestions.append({
+                            "path": entry.path,
+                            "is_git_repo": is_git_repo
+                        })
 
                 # Sort: Git repos first, then alphabetically
                 suggestions.sort(key=lambda x: (not x["is_git_repo"], x["path"]))
@@ -2132,7 +2147,7 @@ def search_repo_paths(request: PathSearchRequest):
                 # Extract just the paths
                 paths = [s["path"] for s in suggestions]
 
-                return {"success": True, "suggestions": paths}
+                return {"success": True, "suggestions": paths, "truncated": truncated}
             except PermissionError:
                 return {"success": True, "suggestions": []}
 
@@ -2163,20 +2178,27 @@ def list_projects_in_folder(request: FolderRequest):
             return {"success": True, "projects": []}
 
         projects = []
+        truncated = False
 
         try:
-            for item in sorted(folder.iterdir()):
-                if item.is_dir() and not item.name.startswith('.'):
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
                     # Check if it's a git repo
-                    if (item / ".git").exists():
+                    if os.path.exists(os.path.join(entry.path, ".git")):
+                        if len(projects) >= MAX_FOLDER_SCAN_MATCHES:
+                            truncated = True
+                            break
                         projects.append({
-                            "name": item.name,
-                            "path": str(item)
+                            "name": entry.name,
+                            "path": entry.path
                         })
         except PermissionError:
             pass
 
-        return {"success": True, "projects": projects}
+        projects.sort(key=lambda p: p["name"])
+        return {"success": True, "projects": projects, "truncated": truncated}
 
     except Exception as e:
         return {"success": True, "projects": []}
@@ -2846,20 +2868,37 @@ def get_prompt_logs(
     offset: int = 0,
     session_id: Optional[str] = None,
     provider: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    cursor_timestamp: Optional[str] = None,
+    cursor_id: Optional[int] = None,
+    include_previews: bool = True
 ):
     """Get prompt logs for the current repository."""
     try:
         repo_path = REPO_PATH if REPO_PATH else Path.cwd()
         logger = PromptLogger(repo_path)
+        cursor = None
+        if cursor_timestamp is not None and cursor_id is not None:
+            cursor = (cursor_timestamp, cursor_id)
         prompts = logger.get_prompts(
             limit=limit,
             offset=offset,
             session_id=session_id,
             provider=provider,
-            status=status
+            status=status,
+            cursor=cursor,
+            include_previews=include_previews
         )
-        return {"success": True, "prompts": prompts, "count": len(prompts)}
+        # Keyset cursor for the following page (pass back as cursor_timestamp/cursor_id)
+        next_cursor = None
+        if len(prompts) == limit:
+            next_cursor = {"timestamp": prompts[-1]["timestamp"], "id": prompts[-1]["id"]}
+        return {
+            "success": True,
+            "prompts": prompts,
+            "count": len(prompts),
+            "nextCursor": next_cursor
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -2941,8 +2980,10 @@ def clear_prompt_logs():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def run_server(repo_path: Optional[Path] = None, port: int = 8081, open_browser: bool = True):
-    """Run the FastAPI server."""
+def run_server(
+    repo_path: Optional[Path] = None, port: int = 8081, open_browser: bool = True, quiet: bool = False
+):
+    """Run the FastAPI server (quiet skips the startup banner on stdout)."""
     global REPO_PATH
     REPO_PATH = repo_path
 
@@ -2958,9 +2999,10 @@ def run_server(repo_path: Optional[Path] = None, port: int = 8081, open_browser:
 
         threading.Thread(target=open_browser_delayed, daemon=True).start()
 
-    print(f"\n🐵 Branch Monkey Web Interface")
-    print(f"   Running on http://localhost:{port}")
-    print(f"   Press Ctrl+C to quit\n")
+    if not quiet:
+        print(f"\n🐵 Branch Monkey Web Interface")
+        print(f"   Running on http://localhost:{port}")
+        print(f"   Press Ctrl+C to quit\n")
 
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
@@ -5,12 +5,50 @@ This hook is triggered by Claude Code when a conversation stops or ends.
 """
 
 import json
+import os
 import sys
 import sqlite3
 from pathlib import Path
 from datetime import datetime
 import subprocess
 
+# Optional faster JSON parsing; falls back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept bytes and raise a json.JSONDecodeError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Reused for the debug log's incremental payload dumps
+_DEBUG_ENCODER = json.JSONEncoder(indent=2)
+
+
+def open_debug_log():
+    """Open ~/.branch_monkey/hook_debug.log for appending if BRANCH_MONKEY_DEBUG is set."""
+    if not os.environ.get('BRANCH_MONKEY_DEBUG'):
+        return None
+    debug_log = Path.home() / '.branch_monkey' / 'hook_debug.log'
+    debug_log.parent.mkdir(parents=True, exist_ok=True)
+    return open(debug_log, 'a', buffering=1)
+
+
+def dumps_bounded(obj, limit=4000):
+    """JSON-encode obj for the debug log, stopping once limit characters are produced.
+
+    Tool payloads can carry whole file contents; the encoder works
+    incrementally, so the rest of a large payload is never encoded.
+    """
+    parts = []
+    size = 0
+    for chunk in _DEBUG_ENCODER.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            return ''.join(parts)[:limit] + '...'
+    return ''.join(parts)
+
 
 def get_current_commit_sha():
     """Get the current git HEAD commit SHA."""
@@ -36,7 +74,7 @@ def parse_transcript(transcript_path):
                 if not line.strip():
                     continue
 
-                entry = json.loads(line)
+                entry = _json_loads(line)
                 entry_type = entry.get('type', '')
 
                 # Extract user messages
@@ -153,20 +191,19 @@ def main():
     """Main hook entry point."""
     try:
         # Read hook input from stdin
-        hook_input = json.loads(sys.stdin.read())
+        hook_input = _json_loads(sys.stdin.buffer.read())
 
-        # Debug: log what we received
-        debug_log = Path.home() / '.branch_monkey' / 'hook_debug.log'
-        debug_log.parent.mkdir(parents=True, exist_ok=True)
-        with open(debug_log, 'a') as f:
-            f.write(f"\n{datetime.now()}: Hook received: {json.dumps(hook_input, indent=2)}\n")
+        # Debug: log what we received (only with BRANCH_MONKEY_DEBUG set)
+        debug_log = open_debug_log()
+        if debug_log:
+            debug_log.write(f"\n{datetime.now()}: Hook received: {dumps_bounded(hook_input)}\n")
 
         # Get transcript path
         transcript_path = Path(hook_input.get('transcript_path', ''))
         if not transcript_path.exists():
             print(f"Transcript not found: {transcript_path}", file=sys.stderr)
-            with open(debug_log, 'a') as f:
-                f.write(f"ERROR: Transcript not found at {transcript_path}\n")
+            if debug_log:
+                debug_log.write(f"ERROR: Transcript not found at {transcript_path}\n")
             return
 
         # Get current working directory (repo path)
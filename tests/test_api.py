@@ -0,0 +1,21 @@
+"""Tests for the public API helpers."""
+
+from datetime import datetime
+
+from branch_monkey.api import to_dict
+from branch_monkey.core.checkpoint import Checkpoint
+
+
+def test_to_dict_includes_checkpoint_properties():
+    checkpoint = Checkpoint(
+        id="0123456789abcdef",
+        message="save",
+        timestamp=datetime(2000, 1, 1),
+        author="someone",
+    )
+
+    data = to_dict(checkpoint)
+
+    assert data["id"] == "0123456789abcdef"
+    assert data["short_id"] == "0123456"
+    assert data["age"] == checkpoint.age
@@ -0,0 +1,47 @@
+"""Tests for rendering the commit graph."""
+
+import subprocess
+
+from branch_monkey.core.graph import GitGraph, _format_age_seconds, _next_age_change
+
+
+def _make_repo(path, commits):
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    for i in range(commits):
+        subprocess.run(
+            ["git", "-C", str(path), "-c", "user.name=a", "-c", "user.email=a@b",
+             "commit", "-q", "--allow-empty", "-m", f"commit {i}"],
+            check=True,
+        )
+
+
+def test_next_age_change_is_where_the_age_text_changes():
+    for seconds in [0, 59, 60, 61, 119, 3599, 3600, 3601, 86399, 86400, 40 * 86400, 400 * 86400]:
+        change = _next_age_change(seconds)
+        assert _format_age_seconds(change - 1) == _format_age_seconds(seconds)
+        assert _format_age_seconds(change) != _format_age_seconds(seconds)
+
+
+def test_render_is_reused_until_the_graph_is_rebuilt(tmp_path, monkeypatch):
+    _make_repo(tmp_path, 3)
+    graph = GitGraph(tmp_path)
+    renders = []
+    render_iter = graph._render_graph_iter
+
+    def counting_render_iter(*args):
+        renders.append(args)
+        return render_iter(*args)
+
+    monkeypatch.setattr(graph, "_render_graph_iter", counting_render_iter)
+
+    nodes = graph.build_graph()
+    first = graph.render_graph(nodes)
+    assert [line.text for line in graph.render_graph(nodes)] == [line.text for line in first]
+    assert len(renders) == 1
+
+    graph.render_graph(nodes, width=60)
+    assert len(renders) == 2
+
+    rebuilt = graph.build_graph()
+    graph.render_graph(rebuilt, width=60)
+    assert len(renders) == 3
@@ -0,0 +1,19 @@
+"""Tests for reading prompt logs back."""
+
+from branch_monkey.core.prompts import PromptLogger
+
+
+def test_get_prompts_includes_previews_unless_asked_not_to(tmp_path):
+    logger = PromptLogger(tmp_path)
+    try:
+        logger.log_prompt("anthropic", "claude", prompt_preview="hello", response_preview="hi")
+
+        [entry] = logger.get_prompts()
+        [cheap_entry] = logger.get_prompts(include_previews=False)
+    finally:
+        logger.close()
+
+    assert entry["promptPreview"] == "hello"
+    assert entry["responsePreview"] == "hi"
+    assert cheap_entry["promptPreview"] == ""
+    assert cheap_entry["responsePreview"] == ""
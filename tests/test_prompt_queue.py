@@ -0,0 +1,100 @@
+"""Tests for draining the prompt queue into the prompt log database."""
+
+import os
+import sqlite3
+import threading
+
+from branch_monkey.core.prompts import (
+    PromptLogger,
+    get_local_db_path,
+    get_prompt_queue_path,
+    queue_claude_code_prompt,
+)
+
+
+def _queue_prompts(repo_path, count):
+    for i in range(count):
+        queue_claude_code_prompt(
+            cwd=str(repo_path),
+            model="claude-sonnet-4-20250514",
+            input_tokens=i,
+            output_tokens=1,
+            duration_ms=1000,
+            session_id="session",
+        )
+
+
+def _logged_count(repo_path):
+    conn = sqlite3.connect(get_local_db_path(repo_path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM prompt_logs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _claim_files(repo_path):
+    return list(get_prompt_queue_path(repo_path).parent.glob("*.draining"))
+
+
+def test_concurrent_drains_log_every_prompt_once(tmp_path):
+    logger = PromptLogger(tmp_path)
+    errors = []
+    done = threading.Event()
+
+    def drain():
+        while not done.is_set():
+            try:
+                logger.drain_queue()
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+    threads = [threading.Thread(target=drain) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(30):
+            _queue_prompts(tmp_path, 100)
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+
+    logger.drain_queue()
+    logger.close()
+
+    assert errors == []
+    assert _logged_count(tmp_path) == 3000
+    assert _claim_files(tmp_path) == []
+
+
+def test_drain_picks_up_claims_left_by_dead_drains(tmp_path):
+    logger = PromptLogger(tmp_path)
+    queue_path = get_prompt_queue_path(tmp_path)
+
+    # A claim left by this pid with no drain running, and an old-style one
+    _queue_prompts(tmp_path, 2)
+    os.replace(queue_path, queue_path.with_name(f"{queue_path.name}.{os.getpid()}.1.x.draining"))
+    _queue_prompts(tmp_path, 3)
+    old_style = queue_path.with_name(f"{queue_path.name}.1.draining")
+    os.replace(queue_path, old_style)
+    os.utime(old_style, (0, 0))
+    _queue_prompts(tmp_path, 1)
+
+    assert logger.drain_queue() == 6
+    logger.close()
+
+    assert _logged_count(tmp_path) == 6
+    assert _claim_files(tmp_path) == []
+
+
+def test_drain_leaves_another_process_recent_claim(tmp_path):
+    logger = PromptLogger(tmp_path)
+    queue_path = get_prompt_queue_path(tmp_path)
+
+    _queue_prompts(tmp_path, 2)
+    claim = queue_path.with_name(f"{queue_path.name}.1.{2**62}.x.draining")
+    os.replace(queue_path, claim)
+
+    assert logger.drain_queue() == 0
+    logger.close()
+    assert claim.exists()
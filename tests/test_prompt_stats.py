@@ -0,0 +1,72 @@
+"""Tests for the prompt log statistics."""
+
+import sqlite3
+
+from branch_monkey.core.prompts import PromptLogger, get_local_db_path
+
+
+def _create_legacy_db(repo_path):
+    """Create a prompt_logs table whose numeric columns allow NULL."""
+    db_path = get_local_db_path(repo_path)
+    db_path.parent.mkdir(parents=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE prompt_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT,
+            provider TEXT,
+            model TEXT,
+            input_tokens INTEGER,
+            output_tokens INTEGER,
+            total_tokens INTEGER,
+            cost REAL,
+            duration REAL,
+            prompt_preview TEXT,
+            response_preview TEXT,
+            status TEXT,
+            error_message TEXT,
+            session_id TEXT,
+            user TEXT,
+            tool_name TEXT,
+            metadata TEXT
+        )
+        """
+    )
+    return conn
+
+
+def test_stats_treat_null_columns_like_the_sql_aggregates(tmp_path):
+    conn = _create_legacy_db(tmp_path)
+    rows = [
+        ("openai", "gpt", None, None, None, None, None, "success"),
+        ("anthropic", "claude", 10, 5, 15, 0.5, 1000.0, "success"),
+        ("anthropic", "claude", 20, 5, 25, 0.25, None, "error"),
+    ]
+    conn.executemany(
+        """
+        INSERT INTO prompt_logs (timestamp, provider, model, input_tokens, output_tokens,
+                                 total_tokens, cost, duration, status)
+        VALUES ('2026-01-01T00:00:00', ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+    logger = PromptLogger(tmp_path)
+    try:
+        stats = logger.get_stats()
+    finally:
+        logger.close()
+
+    assert stats["totalPrompts"] == 3
+    assert stats["totalInputTokens"] == 30
+    assert stats["totalTokens"] == 40
+    assert stats["totalCost"] == 0.75
+    assert stats["avgDuration"] == 1000.0
+    assert stats["errorCount"] == 1
+    assert stats["providersUsed"] == 2
+    assert stats["modelsUsed"] == 2
+    assert stats["byProvider"]["openai"] == {"count": 1, "cost": 0, "tokens": 0}
+    assert stats["byProvider"]["anthropic"] == {"count": 2, "cost": 0.75, "tokens": 40}